@@ -2,15 +2,85 @@
 """
 Simple script to download NBA team logos
 Run this once to get all team logos for your reports
+Pass --refresh to revalidate existing logos against the CDN
 """
 
 import os
-import requests
+import sys
+import json
+import asyncio
+import aiohttp
 from pathlib import Path
-import time
 
-def download_nba_logos():
-    """Download all NBA team logos from ESPN CDN"""
+LOGO_URL = 'https://a.espncdn.com/i/teamlogos/nba/500/{team}.png'
+MAX_CONNECTIONS = 10
+CHUNK_SIZE = 65536
+ETAGS_FILE = '.etags.json'
+
+def _load_validators(logo_dir):
+    """Load saved ETag/Last-Modified headers keyed by team"""
+    path = logo_dir / ETAGS_FILE
+    if not path.exists():
+        return {}
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_validators(logo_dir, validators):
+    """Persist ETag/Last-Modified headers next to the logos"""
+    with open(logo_dir / ETAGS_FILE, 'w') as f:
+        json.dump(validators, f, indent=2)
+
+async def _fetch(session, team, output_path, cached=None):
+    """
+    Fetch a single team logo, streaming the body straight to output_path
+    
+    Returns (team, downloaded, error message or None, validators).
+    A 304 Not Modified comes back as not downloaded without an error.
+    """
+    # ESPN CDN URL - reliable and good quality
+    url = LOGO_URL.format(team=team.lower())
+    
+    # Conditional request when we already hold a copy
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+    
+    try:
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304:
+                return team, False, None, cached
+            if response.status == 200:
+                # Write to a temporary file and rename so an interrupted
+                # download never leaves a truncated PNG behind
+                tmp_path = output_path.with_suffix('.png.part')
+                with open(tmp_path, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                        f.write(chunk)
+                os.replace(tmp_path, output_path)
+                validators = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified')
+                }
+                return team, True, None, validators
+            return team, False, f"Status: {response.status}", cached
+    except Exception as e:
+        output_path.with_suffix('.png.part').unlink(missing_ok=True)
+        return team, False, f"Error: {str(e)[:30]}", cached
+
+async def download_nba_logos(refresh=False):
+    """
+    Download all NBA team logos from ESPN CDN
+    
+    Args:
+        refresh: Revalidate logos already on disk with conditional GETs
+                 instead of skipping them
+    """
     
     # Create directory
     logo_dir = Path('assets/teams')
@@ -28,37 +98,43 @@ def download_nba_logos():
     
     success_count = 0
     fail_count = 0
+    validators = _load_validators(logo_dir)
     
+    # Skip logos that already exist unless refreshing
+    existing = {entry.name for entry in os.scandir(logo_dir)}
+    to_fetch = []
     for team in teams:
-        # ESPN CDN URL - reliable and good quality
-        url = f'https://a.espncdn.com/i/teamlogos/nba/500/{team.lower()}.png'
-        output_path = logo_dir / f'{team}.png'
-        
-        # Skip if already exists
-        if output_path.exists():
+        if f'{team}.png' not in existing:
+            validators.pop(team, None)
+            to_fetch.append(team)
+        elif refresh:
+            to_fetch.append(team)
+        else:
             print(f"✓ {team}: Already exists")
             success_count += 1
-            continue
-        
-        try:
-            print(f"  Downloading {team}...", end='')
-            response = requests.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                with open(output_path, 'wb') as f:
-                    f.write(response.content)
-                print(f" ✓")
-                success_count += 1
-            else:
-                print(f" ✗ (Status: {response.status_code})")
-                fail_count += 1
-                
-        except Exception as e:
-            print(f" ✗ (Error: {str(e)[:30]})")
+    
+    # One pooled session; all downloads run concurrently on the event loop
+    connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS)
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        results = await asyncio.gather(
+            *[_fetch(session, t, logo_dir / f'{t}.png', validators.get(t)) for t in to_fetch]
+        )
+    
+    for team, downloaded, error, team_validators in results:
+        if error:
+            print(f"  Downloading {team}... ✗ ({error})")
             fail_count += 1
+            continue
         
-        # Be nice to the server
-        time.sleep(0.5)
+        if downloaded:
+            print(f"  Downloading {team}... ✓")
+        else:
+            print(f"✓ {team}: Unchanged")
+        validators[team] = team_validators
+        success_count += 1
+    
+    _save_validators(logo_dir, validators)
     
     print("\n" + "=" * 40)
     print(f"Complete! Downloaded: {success_count}/{len(teams)}")
@@ -69,4 +145,4 @@ def download_nba_logos():
     return success_count, fail_count
 
 if __name__ == "__main__":
-    download_nba_logos()
\ No newline at end of file
+    asyncio.run(download_nba_logos(refresh='--refresh' in sys.argv))
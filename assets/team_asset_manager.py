@@ -4,11 +4,32 @@ Handles team logos, colors, and branding assets
 """
 
 import os
+import shutil
+import asyncio
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 import json
 
+CHUNK_SIZE = 65536
+COPY_BUFSIZE = 1024 * 1024
+
+# Placeholder logo, filled in with bytes %-formatting
+_SVG_TMPL = (
+    b'<svg width="%(size)d" height="%(size)d" xmlns="http://www.w3.org/2000/svg">'
+    b'<rect width="%(size)d" height="%(size)d" fill="%(primary)s"/>'
+    b'<text x="50%%" y="50%%" text-anchor="middle" dy=".3em" '
+    b'fill="%(secondary)s" font-family="Arial, sans-serif" '
+    b'font-size="%(font_size)d" font-weight="bold">%(abbr)s</text>'
+    b'</svg>'
+)
+
+# Team names and brand colors ship with the repo alongside the logos
+TEAM_CONFIG_PATH = Path(__file__).parent / 'teams' / 'team_config.json'
+
 class TeamAssetsManager:
     """Manage NBA team logos and brand colors"""
     
@@ -16,159 +37,24 @@ class TeamAssetsManager:
         self.assets_dir = Path('assets/teams')
         self.assets_dir.mkdir(parents=True, exist_ok=True)
         
-        # Team configurations with colors and logo sources
-        self.teams = {
-            'ATL': {
-                'name': 'Atlanta Hawks',
-                'colors': {'primary': '#E03A3E', 'secondary': '#C1D32F', 'tertiary': '#26282A'},
-                'abbreviation': 'ATL'
-            },
-            'BOS': {
-                'name': 'Boston Celtics',
-                'colors': {'primary': '#007A33', 'secondary': '#BA9653', 'tertiary': '#963821'},
-                'abbreviation': 'BOS'
-            },
-            'BKN': {
-                'name': 'Brooklyn Nets',
-                'colors': {'primary': '#000000', 'secondary': '#FFFFFF', 'tertiary': '#777D84'},
-                'abbreviation': 'BKN'
-            },
-            'CHA': {
-                'name': 'Charlotte Hornets',
-                'colors': {'primary': '#1D1160', 'secondary': '#00788C', 'tertiary': '#A1A1A4'},
-                'abbreviation': 'CHA'
-            },
-            'CHI': {
-                'name': 'Chicago Bulls',
-                'colors': {'primary': '#CE1141', 'secondary': '#000000', 'tertiary': '#FFFFFF'},
-                'abbreviation': 'CHI'
-            },
-            'CLE': {
-                'name': 'Cleveland Cavaliers',
-                'colors': {'primary': '#860038', 'secondary': '#041E42', 'tertiary': '#FDBB30'},
-                'abbreviation': 'CLE'
-            },
-            'DAL': {
-                'name': 'Dallas Mavericks',
-                'colors': {'primary': '#00538C', 'secondary': '#002B5E', 'tertiary': '#B8C4CA'},
-                'abbreviation': 'DAL'
-            },
-            'DEN': {
-                'name': 'Denver Nuggets',
-                'colors': {'primary': '#0E2240', 'secondary': '#FEC524', 'tertiary': '#8B2131'},
-                'abbreviation': 'DEN'
-            },
-            'DET': {
-                'name': 'Detroit Pistons',
-                'colors': {'primary': '#C8102E', 'secondary': '#1D42BA', 'tertiary': '#BEC0C2'},
-                'abbreviation': 'DET'
-            },
-            'GSW': {
-                'name': 'Golden State Warriors',
-                'colors': {'primary': '#1D428A', 'secondary': '#FFC72C', 'tertiary': '#FFFFFF'},
-                'abbreviation': 'GSW'
-            },
-            'HOU': {
-                'name': 'Houston Rockets',
-                'colors': {'primary': '#CE1141', 'secondary': '#000000', 'tertiary': '#C4CED4'},
-                'abbreviation': 'HOU'
-            },
-            'IND': {
-                'name': 'Indiana Pacers',
-                'colors': {'primary': '#002D62', 'secondary': '#FDBB30', 'tertiary': '#BEC0C2'},
-                'abbreviation': 'IND'
-            },
-            'LAC': {
-                'name': 'LA Clippers',
-                'colors': {'primary': '#C8102E', 'secondary': '#1D428A', 'tertiary': '#BEC0C2'},
-                'abbreviation': 'LAC'
-            },
-            'LAL': {
-                'name': 'Los Angeles Lakers',
-                'colors': {'primary': '#552583', 'secondary': '#FDB927', 'tertiary': '#000000'},
-                'abbreviation': 'LAL'
-            },
-            'MEM': {
-                'name': 'Memphis Grizzlies',
-                'colors': {'primary': '#5D76A9', 'secondary': '#12173F', 'tertiary': '#F5B112'},
-                'abbreviation': 'MEM'
-            },
-            'MIA': {
-                'name': 'Miami Heat',
-                'colors': {'primary': '#98002E', 'secondary': '#F9A01B', 'tertiary': '#000000'},
-                'abbreviation': 'MIA'
-            },
-            'MIL': {
-                'name': 'Milwaukee Bucks',
-                'colors': {'primary': '#00471B', 'secondary': '#EEE1C6', 'tertiary': '#0077C0'},
-                'abbreviation': 'MIL'
-            },
-            'MIN': {
-                'name': 'Minnesota Timberwolves',
-                'colors': {'primary': '#0C2340', 'secondary': '#236192', 'tertiary': '#9EA2A2'},
-                'abbreviation': 'MIN'
-            },
-            'NOP': {
-                'name': 'New Orleans Pelicans',
-                'colors': {'primary': '#0C2340', 'secondary': '#C8102E', 'tertiary': '#85714D'},
-                'abbreviation': 'NOP'
-            },
-            'NYK': {
-                'name': 'New York Knicks',
-                'colors': {'primary': '#006BB6', 'secondary': '#F58426', 'tertiary': '#BEC0C2'},
-                'abbreviation': 'NYK'
-            },
-            'OKC': {
-                'name': 'Oklahoma City Thunder',
-                'colors': {'primary': '#007AC1', 'secondary': '#EF3B24', 'tertiary': '#002D62'},
-                'abbreviation': 'OKC'
-            },
-            'ORL': {
-                'name': 'Orlando Magic',
-                'colors': {'primary': '#0077C0', 'secondary': '#C4CED4', 'tertiary': '#000000'},
-                'abbreviation': 'ORL'
-            },
-            'PHI': {
-                'name': 'Philadelphia 76ers',
-                'colors': {'primary': '#006BB6', 'secondary': '#ED174C', 'tertiary': '#002B5C'},
-                'abbreviation': 'PHI'
-            },
-            'PHX': {
-                'name': 'Phoenix Suns',
-                'colors': {'primary': '#1D1160', 'secondary': '#E56020', 'tertiary': '#000000'},
-                'abbreviation': 'PHX'
-            },
-            'POR': {
-                'name': 'Portland Trail Blazers',
-                'colors': {'primary': '#E03A3E', 'secondary': '#000000', 'tertiary': '#FFFFFF'},
-                'abbreviation': 'POR'
-            },
-            'SAC': {
-                'name': 'Sacramento Kings',
-                'colors': {'primary': '#5A2D81', 'secondary': '#63727A', 'tertiary': '#000000'},
-                'abbreviation': 'SAC'
-            },
-            'SAS': {
-                'name': 'San Antonio Spurs',
-                'colors': {'primary': '#C4CED4', 'secondary': '#000000', 'tertiary': '#FFFFFF'},
-                'abbreviation': 'SAS'
-            },
-            'TOR': {
-                'name': 'Toronto Raptors',
-                'colors': {'primary': '#CE1141', 'secondary': '#000000', 'tertiary': '#A1A1A4'},
-                'abbreviation': 'TOR'
-            },
-            'UTA': {
-                'name': 'Utah Jazz',
-                'colors': {'primary': '#002B5C', 'secondary': '#F9A01B', 'tertiary': '#00471B'},
-                'abbreviation': 'UTA'
-            },
-            'WAS': {
-                'name': 'Washington Wizards',
-                'colors': {'primary': '#002B5C', 'secondary': '#E31837', 'tertiary': '#C4CED4'},
-                'abbreviation': 'WAS'
-            }
-        }
+        # Sidecar of ETag/Last-Modified headers used to revalidate logos
+        self.etags_path = self.assets_dir / '.etags.json'
+        
+        # Shared session so single on-demand logo fetches reuse the CDN connection
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=16,
+                                                   max_retries=Retry(total=3, backoff_factor=0.3)))
+        
+        # Team configurations with colors and logo sources, loaded on first use
+        self._teams_path = TEAM_CONFIG_PATH
+        self._teams = None
+    
+    @property
+    def teams(self) -> Dict[str, Dict]:
+        """Team configurations keyed by abbreviation"""
+        if self._teams is None:
+            self._teams = json.loads(self._teams_path.read_bytes())
+        return self._teams
     
     def get_logo_urls(self) -> Dict[str, Dict[str, str]]:
         """
@@ -191,34 +77,125 @@ class TeamAssetsManager:
         
         return logo_sources
     
-    def download_team_logos(self, source='espn'):
+    def _load_validators(self) -> Dict[str, Dict[str, Optional[str]]]:
+        """Load saved ETag/Last-Modified headers keyed by team"""
+        if not self.etags_path.exists():
+            return {}
+        try:
+            with open(self.etags_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_validators(self, validators: Dict[str, Dict[str, Optional[str]]]):
+        """Persist ETag/Last-Modified headers next to the logos"""
+        with open(self.etags_path, 'w') as f:
+            json.dump(validators, f, indent=2)
+    
+    async def _fetch_logo(self, session: aiohttp.ClientSession, team_abbr: str, url: str,
+                          cached: Optional[Dict] = None) -> Tuple[str, bool, Optional[str], Optional[Dict]]:
         """
-        Download all team logos from specified source
+        Fetch a single logo, streaming the body straight to disk
+        
+        Returns (team, downloaded, error message or None, validators).
+        A 304 Not Modified comes back as not downloaded without an error.
+        """
+        # Written under a temporary name and renamed once complete, so an
+        # interrupted download never leaves a truncated PNG behind
+        output_path = self.assets_dir / f'{team_abbr}.png'
+        tmp_path = output_path.with_suffix('.png.part')
+        
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304:
+                    return team_abbr, False, None, cached
+                if response.status == 200:
+                    with open(tmp_path, 'wb') as f:
+                        async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                            f.write(chunk)
+                    os.replace(tmp_path, output_path)
+                    validators = {
+                        'etag': response.headers.get('ETag'),
+                        'last_modified': response.headers.get('Last-Modified')
+                    }
+                    return team_abbr, True, None, validators
+                return team_abbr, False, str(response.status), cached
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            return team_abbr, False, str(e), cached
+    
+    async def download_team_logos_async(self, source='espn', max_connections: int = 10,
+                                        refresh: bool = False):
+        """
+        Download all team logos from specified source concurrently
         
         Args:
             source: 'espn' or 'sportslogos'
+            max_connections: Connection limit for the shared client session
+            refresh: Revalidate existing logos with conditional GETs instead of skipping them
         """
         logo_urls = self.get_logo_urls()
+        validators = self._load_validators()
         
+        existing = {entry.name for entry in os.scandir(self.assets_dir)}
+        
+        to_fetch = {}
         for team_abbr, sources in logo_urls.items():
             if source in sources:
-                url = sources[source]
-                output_path = self.assets_dir / f'{team_abbr}.png'
-                
-                if output_path.exists():
+                if f'{team_abbr}.png' not in existing:
+                    validators.pop(team_abbr, None)
+                elif not refresh:
                     print(f"✓ {team_abbr} logo already exists")
                     continue
                 
-                try:
-                    response = requests.get(url, timeout=10)
-                    if response.status_code == 200:
-                        with open(output_path, 'wb') as f:
-                            f.write(response.content)
-                        print(f"✓ Downloaded {team_abbr} logo")
-                    else:
-                        print(f"✗ Failed to download {team_abbr} logo: {response.status_code}")
-                except Exception as e:
-                    print(f"✗ Error downloading {team_abbr} logo: {e}")
+                to_fetch[team_abbr] = sources[source]
+        
+        connector = aiohttp.TCPConnector(limit=max_connections)
+        timeout = aiohttp.ClientTimeout(total=10)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            results = await asyncio.gather(
+                *[self._fetch_logo(session, t, url, validators.get(t)) for t, url in to_fetch.items()]
+            )
+        
+        for team_abbr, downloaded, error, team_validators in results:
+            if error:
+                print(f"✗ Failed to download {team_abbr} logo: {error}")
+                continue
+            
+            if downloaded:
+                print(f"✓ Downloaded {team_abbr} logo")
+            else:
+                print(f"✓ {team_abbr} logo unchanged")
+            validators[team_abbr] = team_validators
+        
+        self._save_validators(validators)
+    
+    def download_team_logos(self, source='espn', max_connections: int = 10, refresh: bool = False):
+        """
+        Download all team logos from specified source
+        
+        Args:
+            source: 'espn' or 'sportslogos'
+            max_connections: Connection limit for the shared client session
+            refresh: Revalidate existing logos with conditional GETs instead of skipping them
+        
+        Inside a running event loop (a notebook, the async report path) asyncio.run()
+        can't be used, so await download_team_logos_async() there instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self.download_team_logos_async(source, max_connections, refresh))
+            return
+        raise RuntimeError("download_team_logos() was called from a running event loop; "
+                           "await download_team_logos_async() instead")
     
     def generate_svg_placeholder(self, team_abbr: str, size: int = 100):
         """
@@ -229,18 +206,13 @@ class TeamAssetsManager:
         primary = colors.get('primary', '#000000')
         secondary = colors.get('secondary', '#FFFFFF')
         
-        svg = f'''<svg width="{size}" height="{size}" xmlns="http://www.w3.org/2000/svg">
-            <rect width="{size}" height="{size}" fill="{primary}"/>
-            <text x="50%" y="50%" text-anchor="middle" dy=".3em" 
-                  fill="{secondary}" font-family="Arial, sans-serif" 
-                  font-size="{size//3}" font-weight="bold">
-                {team_abbr}
-            </text>
-        </svg>'''
+        svg = _SVG_TMPL % {
+            b'size': size, b'primary': primary.encode(), b'secondary': secondary.encode(),
+            b'font_size': size // 3, b'abbr': team_abbr.encode()
+        }
         
         output_path = self.assets_dir / f'{team_abbr}_placeholder.svg'
-        with open(output_path, 'w') as f:
-            f.write(svg)
+        output_path.write_bytes(svg)
         
         return output_path
     
@@ -251,8 +223,13 @@ class TeamAssetsManager:
     def save_team_config(self):
         """Save team configuration to JSON for easy access"""
         config_path = self.assets_dir / 'team_config.json'
-        with open(config_path, 'w') as f:
-            json.dump(self.teams, f, indent=2)
+        data = json.dumps(self.teams, indent=2).encode()
+        
+        # Skip the write only when the file already holds exactly this mapping
+        if config_path.exists() and config_path.read_bytes() == data:
+            print(f"✓ Team configuration already up to date at {config_path}")
+            return
+        config_path.write_bytes(data)
         print(f"✓ Team configuration saved to {config_path}")
     
     def get_logo_path(self, team_abbr: str) -> Path:
@@ -265,11 +242,16 @@ class TeamAssetsManager:
             if team_abbr in logo_urls:
                 url = logo_urls[team_abbr]['espn']
                 try:
-                    response = requests.get(url, timeout=10)
-                    if response.status_code == 200:
-                        with open(logo_path, 'wb') as f:
-                            f.write(response.content)
+                    with self.session.get(url, stream=True, timeout=10) as response:
+                        if response.status_code == 200:
+                            # Copy straight from the underlying urllib3 stream
+                            response.raw.decode_content = True
+                            tmp_path = logo_path.with_suffix('.png.part')
+                            with open(tmp_path, 'wb') as f:
+                                shutil.copyfileobj(response.raw, f, length=COPY_BUFSIZE)
+                            os.replace(tmp_path, logo_path)
                 except:
+                    logo_path.with_suffix('.png.part').unlink(missing_ok=True)
                     # Create placeholder if download fails
                     return self.generate_svg_placeholder(team_abbr)
         
@@ -6,24 +6,46 @@ Just test API endpoints and save example outputs for a single game
 
 import os
 import sys
-import json
 import time
+import asyncio
 from pathlib import Path
-import requests
-from requests.auth import HTTPBasicAuth
+from urllib.parse import urlencode
+import httpx
+import orjson
+from diskcache import Cache
 from dotenv import load_dotenv
 
+# Add parent directory to path to import from src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.helpers import RateLimiter, retry_after_seconds
+
 # Load environment variables
 load_dotenv()
 
 class SimpleGameAPIExplorer:
     """Test all MySportsFeeds API endpoints for a single game"""
     
-    def __init__(self, game_id='20241023-MIL-PHI'):
+    # Endpoints fetched once for both teams, then split into away_/home_ files.
+    # Maps endpoint name -> (list key, per-item team key)
+    SPLIT_BY_TEAM = {
+        'team_gamelog': ('gamelogs', 'team'),
+        'player_gamelogs': ('gamelogs', 'team'),
+        'season_stats': ('teamStatsTotals', 'team'),
+        'player_season_stats': ('playerStatsTotals', 'team'),
+        'roster': ('players', 'teamAsOfDate'),
+    }
+    
+    def __init__(self, game_id='20241023-MIL-PHI', max_concurrency=4, verbose=False,
+                 use_cache=True, rate=4.0):
         self.api_key = os.getenv('MSF_API_KEY')
         self.password = os.getenv('MSF_PASSWORD', 'MYSPORTSFEEDS')
         self.base_url = 'https://api.mysportsfeeds.com/v2.1/pull/nba'
-        self.auth = HTTPBasicAuth(self.api_key, self.password)
+        self.auth = (self.api_key or '', self.password)
+        
+        # Persistent HTTP/2 client so requests multiplex over one TLS connection
+        self.client = httpx.Client(http2=True, auth=self.auth, timeout=10.0,
+                                   limits=httpx.Limits(max_keepalive_connections=4))
         
         # Parse game info
         self.game_id = game_id
@@ -43,58 +65,166 @@ class SimpleGameAPIExplorer:
         # Output directory
         self.output_dir = Path(f'api_responses/{self.game_id}')
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Maximum number of requests in flight during run_all_tests
+        self.max_concurrency = max_concurrency
+        
+        # Requests per second allowed across both request paths
+        self.limiter = RateLimiter(rate)
+        
+        # Parse and summarize each response (otherwise one line per endpoint)
+        self.verbose = verbose
+        
+        # Response bodies + ETag/Last-Modified, revalidated with conditional GETs
+        self.cache = Cache('api_responses/.http_cache') if use_cache else None
+    
+    def close(self):
+        """Close the HTTP/2 client and the response cache"""
+        self.client.close()
+        if self.cache is not None:
+            self.cache.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def _cache_key(self, url, params=None):
+        """Normalized cache key for a URL and its query parameters"""
+        return f"{url}?{urlencode(sorted((params or {}).items()))}"
+    
+    def _conditional_headers(self, key):
+        """Build If-None-Match/If-Modified-Since headers from a cached entry"""
+        entry = self.cache.get(key) if self.cache is not None else None
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return entry, headers
+    
+    def _resolve_body(self, key, entry, response):
+        """Return the response body, serving the cached copy on 304 Not Modified"""
+        if response.status_code == 304 and entry:
+            return entry['body']
+        
+        response.raise_for_status()
+        body = response.content
+        
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if self.cache is not None and (etag or last_modified):
+            self.cache.set(key, {'etag': etag, 'last_modified': last_modified, 'body': body})
+        return body
     
     def make_request(self, url, params=None):
-        """Make API request with simple retry"""
+        """Make API request with simple retry, returning the raw response body"""
+        key = self._cache_key(url, params)
+        entry, headers = self._conditional_headers(key)
         try:
-            response = requests.get(url, auth=self.auth, params=params)
-            
-            if response.status_code == 429:
-                print(f"Rate limited. Waiting 20 seconds...")
-                time.sleep(20)
-                return self.make_request(url, params)
-            
-            response.raise_for_status()
-            return response.json()
+            while True:
+                self.limiter.acquire()
+                response = self.client.get(url, params=params, headers=headers)
+                
+                if response.status_code != 429:
+                    return self._resolve_body(key, entry, response)
+                
+                # Release the rate-limited response before waiting to retry
+                retry_after = retry_after_seconds(response.headers.get('Retry-After'), default=20)
+                response.close()
+                print(f"Rate limited. Waiting {retry_after:.0f} seconds...")
+                time.sleep(retry_after)
         except Exception as e:
             print(f"Error: {e}")
             return None
     
-    def test_endpoint(self, name, url, params=None):
-        """Test a single endpoint and save response"""
-        print(f"\nTesting: {name}")
-        print(f"URL: {url}")
-        if params:
-            print(f"Params: {params}")
-        
-        data = self.make_request(url, params)
-        
-        if data:
-            # Save response
+    def _save_result(self, name, body):
+        """Save a raw response body and print a short summary"""
+        if body:
+            # Save response exactly as received - no parse/re-serialize round trip
             filepath = self.output_dir / f"{name}.json"
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            filepath.write_bytes(body)
+            
+            print(f"✅ {name}: saved to {filepath} ({len(body):,} bytes)")
+            
+            if name in self.SPLIT_BY_TEAM:
+                self._split_by_team(name, body)
             
-            print(f"✅ Success - saved to {filepath}")
+            if not self.verbose:
+                return
             
             # Show basic info about response
+            try:
+                data = orjson.loads(body)
+            except orjson.JSONDecodeError:
+                data = None
             if isinstance(data, dict):
                 print(f"   Keys: {', '.join(list(data.keys())[:5])}")
         else:
-            print(f"❌ Failed")
+            print(f"❌ {name}: Failed")
+    
+    def _split_by_team(self, name, body):
+        """Write away_/home_ copies of a response that covers both teams"""
+        list_key, team_key = self.SPLIT_BY_TEAM[name]
+        try:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return
         
-        return data
+        items = data.get(list_key, [])
+        for side, team in (('away', self.away_team), ('home', self.home_team)):
+            team_data = dict(data)
+            team_data[list_key] = [item for item in items
+                                   if (item.get(team_key) or {}).get('abbreviation') == team]
+            
+            filepath = self.output_dir / f"{side}_{name}.json"
+            filepath.write_bytes(orjson.dumps(team_data, option=orjson.OPT_INDENT_2))
+            print(f"   {side}: {len(team_data[list_key])} {list_key} -> {filepath}")
     
-    def run_all_tests(self):
-        """Test all available endpoints for this game"""
-        print(f"\n{'='*50}")
-        print(f"Testing API Endpoints for Game: {self.game_id}")
-        print(f"Season: {self.season}")
-        print(f"Output: {self.output_dir}")
-        print(f"{'='*50}")
+    def test_endpoint(self, name, url, params=None):
+        """Test a single endpoint and save response"""
+        print(f"\nTesting: {name}")
+        print(f"URL: {url}")
+        if params:
+            print(f"Params: {params}")
+        
+        body = self.make_request(url, params)
+        self._save_result(name, body)
         
-        # All available endpoints for a single game
-        endpoints = [
+        return body
+    
+    async def _make_request_async(self, client, semaphore, url, params=None):
+        """Make API request on the shared async client, waiting out rate limits"""
+        key = self._cache_key(url, params)
+        entry, headers = self._conditional_headers(key)
+        try:
+            async with semaphore:
+                while True:
+                    await self.limiter.acquire_async()
+                    response = await client.get(url, params=params, headers=headers)
+                    if response.status_code == 429:
+                        retry_after = retry_after_seconds(response.headers.get('Retry-After'), default=20)
+                        print(f"Rate limited. Waiting {retry_after:.0f} seconds...")
+                        await asyncio.sleep(retry_after)
+                        continue
+                    
+                    return self._resolve_body(key, entry, response)
+        except Exception as e:
+            print(f"Error ({url}): {e}")
+            return None
+    
+    async def _test_endpoint_async(self, client, semaphore, name, url, params=None):
+        """Test a single endpoint concurrently and save response"""
+        body = await self._make_request_async(client, semaphore, url, params)
+        self._save_result(name, body)
+        return body
+    
+    def get_endpoints(self):
+        """All available endpoints for this game as (name, url, params)"""
+        teams = f"{self.away_team},{self.home_team}"
+        return [
             # Core endpoints (no addon required)
             ('current_season', f"{self.base_url}/current_season.json", None),
             ('game_info', f"{self.base_url}/{self.season}/games/{self.game_id}.json", None),
@@ -105,30 +235,41 @@ class SimpleGameAPIExplorer:
             ('lineup', f"{self.base_url}/{self.season}/games/{self.game_id}/lineup.json", None),
             ('playbyplay', f"{self.base_url}/{self.season}/games/{self.game_id}/playbyplay.json", {'limit': 50}),
             
-            ('away_team_gamelog', f"{self.base_url}/{self.season}/date/{self.date}/team_gamelogs.json", {'team': self.away_team}),
-            ('home_team_gamelog', f"{self.base_url}/{self.season}/date/{self.date}/team_gamelogs.json", {'team': self.home_team}),
-            
-            ('away_player_gamelogs', f"{self.base_url}/{self.season}/date/{self.date}/player_gamelogs.json", {'team': self.away_team}),
-            ('home_player_gamelogs', f"{self.base_url}/{self.season}/date/{self.date}/player_gamelogs.json", {'team': self.home_team}),
-            
-            ('away_season_stats', f"{self.base_url}/{self.season}/team_stats_totals.json", {'team': self.away_team}),
-            ('home_season_stats', f"{self.base_url}/{self.season}/team_stats_totals.json", {'team': self.home_team}),
-            
-            ('away_player_season_stats', f"{self.base_url}/{self.season}/player_stats_totals.json", {'team': self.away_team}),
-            ('home_player_season_stats', f"{self.base_url}/{self.season}/player_stats_totals.json", {'team': self.home_team}),
+            # Team-scoped endpoints take both teams at once (see SPLIT_BY_TEAM)
+            ('team_gamelog', f"{self.base_url}/{self.season}/date/{self.date}/team_gamelogs.json", {'team': teams}),
+            ('player_gamelogs', f"{self.base_url}/{self.season}/date/{self.date}/player_gamelogs.json", {'team': teams}),
+            ('season_stats', f"{self.base_url}/{self.season}/team_stats_totals.json", {'team': teams}),
+            ('player_season_stats', f"{self.base_url}/{self.season}/player_stats_totals.json", {'team': teams}),
             
             ('standings', f"{self.base_url}/{self.season}/standings.json", {'date': self.date}),
             
             # Other useful endpoints
-            ('injuries', f"{self.base_url}/injuries.json", {'team': f"{self.away_team},{self.home_team}"}),
-            ('away_roster', f"{self.base_url}/players.json", {'team': self.away_team, 'rosterstatus': 'assigned-to-roster'}),
-            ('home_roster', f"{self.base_url}/players.json", {'team': self.home_team, 'rosterstatus': 'assigned-to-roster'}),
+            ('injuries', f"{self.base_url}/injuries.json", {'team': teams}),
+            ('roster', f"{self.base_url}/players.json", {'team': teams, 'rosterstatus': 'assigned-to-roster'}),
         ]
+    
+    async def run_all_tests_async(self):
+        """Test all endpoints concurrently, bounded by max_concurrency"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        limits = httpx.Limits(max_connections=self.max_concurrency)
+        
+        # One HTTP/2 connection carries every request as a separate stream
+        async with httpx.AsyncClient(http2=True, auth=self.auth, timeout=30.0,
+                                     limits=limits) as client:
+            return await asyncio.gather(*[
+                self._test_endpoint_async(client, semaphore, name, url, params)
+                for name, url, params in self.get_endpoints()
+            ])
+    
+    def run_all_tests(self):
+        """Test all available endpoints for this game"""
+        print(f"\n{'='*50}")
+        print(f"Testing API Endpoints for Game: {self.game_id}")
+        print(f"Season: {self.season}")
+        print(f"Output: {self.output_dir}")
+        print(f"{'='*50}\n")
         
-        # Test each endpoint
-        for name, url, params in endpoints:
-            self.test_endpoint(name, url, params)
-            time.sleep(0.5)  # Be nice to the API
+        asyncio.run(self.run_all_tests_async())
         
         print(f"\n{'='*50}")
         print(f"✅ Testing complete!")
@@ -142,11 +283,21 @@ def main():
     parser = argparse.ArgumentParser(description='Test MySportsFeeds API for a single game')
     parser.add_argument('--game-id', type=str, default='20241023-MIL-PHI',
                        help='Game ID format: YYYYMMDD-AWAY-HOME (default: 20241023-MIL-PHI)')
+    parser.add_argument('--concurrency', type=int, default=4,
+                       help='Maximum requests in flight (default: 4)')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Parse each response and show its top-level keys')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Skip the ETag response cache and always download full bodies')
+    parser.add_argument('--rate', type=float, default=4.0,
+                       help='Maximum requests per second (default: 4)')
     
     args = parser.parse_args()
     
-    explorer = SimpleGameAPIExplorer(args.game_id)
-    explorer.run_all_tests()
+    with SimpleGameAPIExplorer(args.game_id, max_concurrency=args.concurrency,
+                               verbose=args.verbose, use_cache=not args.no_cache,
+                               rate=args.rate) as explorer:
+        explorer.run_all_tests()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,6 +3,10 @@ MySportsFeeds API Endpoint Configurations
 Complete list of all available endpoints with their parameters
 """
 
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+
 ENDPOINTS = {
     "CORE": {
         "current_season": {
@@ -203,6 +207,48 @@ ENDPOINTS = {
     }
 }
 
+# Freeze the config into read-only views, interning paths and parameter names
+ENDPOINTS = MappingProxyType({
+    category: MappingProxyType({
+        name: MappingProxyType({
+            **ep,
+            'path': sys.intern(ep['path']),
+            'params': MappingProxyType({sys.intern(k): v for k, v in ep.get('params', {}).items()})
+        })
+        for name, ep in eps.items()
+    })
+    for category, eps in ENDPOINTS.items()
+})
+
+# Placeholders that may appear in an endpoint path
+PLACEHOLDERS = ('{season}', '{date}', '{game}')
+
+
+@dataclass(slots=True, frozen=True)
+class EndpointSpec:
+    """Resolved endpoint entry from ENDPOINTS"""
+    name: str
+    category: str
+    path: str
+    description: str
+    params: tuple
+    placeholders: tuple
+
+
+# Flat name -> spec index so lookups don't walk the nested config
+FLAT_ENDPOINTS = {
+    name: EndpointSpec(
+        name=name,
+        category=category,
+        path=ep['path'],
+        description=ep['description'],
+        params=tuple(ep.get('params', ())),
+        placeholders=tuple(ph for ph in PLACEHOLDERS if ph in ep['path'])
+    )
+    for category, eps in ENDPOINTS.items()
+    for name, ep in eps.items()
+}
+
 # Test data for examples
 TEST_DATA = {
     "season": "2024-2025-regular",
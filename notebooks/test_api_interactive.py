@@ -7,11 +7,20 @@ Allows you to test individual endpoints with custom parameters
 import os
 import sys
 import json
+import re
 import time
+import base64
+import hashlib
+import concurrent.futures
+from functools import cached_property
+import orjson
 from pathlib import Path
+from urllib.parse import urlencode
 from datetime import datetime
+from itertools import islice
 import requests
-from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 import click
 from rich.console import Console
@@ -21,137 +30,261 @@ from rich.syntax import Syntax
 from rich import print as rprint
 from rich.prompt import Prompt, Confirm
 
-# Load environment variables
-load_dotenv()
-
-console = Console()
-
 # Import endpoint configurations
 sys.path.insert(0, str(Path(__file__).parent))
-from endpoints_config import ENDPOINTS, TEST_DATA, COMMON_STATS
+from endpoints_config import ENDPOINTS, FLAT_ENDPOINTS, TEST_DATA, COMMON_STATS
+
+# Matches every path placeholder so they can all be filled in one pass
+_PLACEHOLDER_RE = re.compile(r'\{(season|date|game)\}')
+
+# Display names for the JSON value types, falling back to __name__ for anything else
+_TYPE_NAME = {dict: 'dict', list: 'list', str: 'str', int: 'int', float: 'float', bool: 'bool'}
+
+# Static Rich renderables reused on every menu/response instead of rebuilt each time
+_WELCOME_PANEL = Panel.fit(
+    "[bold magenta]MySportsFeeds API Interactive Tester[/bold magenta]\n"
+    "Explore and test individual endpoints",
+    title="Welcome"
+)
+_CAT_PANEL = Panel("[bold cyan]Select Endpoint Category[/bold cyan]")
+_STRUCTURE_PANEL = Panel("[bold]Response Structure[/bold]")
+_KEY_TABLE_COLUMNS = (("Key", "cyan"), ("Type", "yellow"), ("Count/Value", "green"))
+
+# Prompt text and TEST_DATA default for each path placeholder
+_PLACEHOLDER_PROMPTS = {
+    '{season}': ("Enter season", 'season'),
+    '{date}': ("Enter date (YYYYMMDD)", 'date'),
+    '{game}': ("Enter game ID (YYYYMMDD-AWAY-HOME)", 'game'),
+}
+
+def _prompt_stats(console):
+    """Prompt for stats after listing a few common ones"""
+    console.print(f"Common stats: {_COMMON_TEAM_STATS}")
+    return Prompt.ask("stats (comma-separated)", default="")
+
+# Parameter-specific prompts; anything not listed gets a plain prompt
+_COMMON_TEAM_STATS = ', '.join(COMMON_STATS['team'][:5])
+_PARAM_PROMPTERS = {
+    'team': lambda console: Prompt.ask("team (e.g., MIL or MIL,LAL)", default=""),
+    'stats': _prompt_stats,
+    'limit': lambda console: Prompt.ask("limit (number)", default=""),
+    'offset': lambda console: Prompt.ask("offset (number)", default=""),
+}
+
+def _shallow_preview(obj, maxkeys=4):
+    """Indented JSON bytes for only the first few keys of a dict"""
+    if isinstance(obj, dict):
+        obj = dict(islice(obj.items(), maxkeys))
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+def _write_file(filepath, data):
+    """Write bytes to filepath (runs on the background I/O thread)"""
+    with open(filepath, 'wb') as f:
+        f.write(data)
+
+class CachedResponse:
+    """Cached body served for a 304, with the parts of Response the tester reads"""
+    
+    status_code = 200
+    
+    def __init__(self, content):
+        self.content = content
+    
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
 
 class InteractiveAPITester:
-    def __init__(self):
+    def __init__(self, use_cache=True):
+        # Existing environment variables win; .env fills in MSF_PASSWORD etc. when unset
+        load_dotenv()
+        
         self.api_key = os.getenv('MSF_API_KEY')
         self.password = os.getenv('MSF_PASSWORD', 'MYSPORTSFEEDS')
         self.base_url = 'https://api.mysportsfeeds.com/v2.1/pull/nba'
-        self.auth = HTTPBasicAuth(self.api_key, self.password)
+        
+        # Reuse one pooled keep-alive connection for the whole session; 429s and
+        # gateway errors are retried by urllib3, which sleeps out any Retry-After
+        self.session = requests.Session()
+        # Encode the basic-auth header once instead of on every request
+        token = base64.b64encode(f"{self.api_key or ''}:{self.password}".encode()).decode()
+        self.session.headers['Authorization'] = f'Basic {token}'
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4, pool_maxsize=8,
+            max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504),
+                              allowed_methods=['GET'], respect_retry_after_header=True)))
         
         # Create output directory
         self.output_dir = Path('api_responses')
         self.output_dir.mkdir(exist_ok=True)
         
-        # Track request count for rate limiting
+        # Conditional-GET cache: {key}.json holds validators, {key}.body the payload
+        self.use_cache = use_cache
+        self._cache_dir = Path('api_cache')
+        if use_cache:
+            self._cache_dir.mkdir(exist_ok=True)
+        
+        # Track request count and the earliest time the next request may go out
         self.request_count = 0
-        self.last_request_time = None
+        self._min_interval = 1.0
+        self._next_allowed = 0.0
+        
+        # Response files are written on a background thread so the next prompt isn't blocked
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._pending_writes = []
+        
+        # Menu choices never change, so build them once
+        self._categories = list(ENDPOINTS.keys())
+        self._category_choices = [str(i) for i in range(1, len(ENDPOINTS)+1)]
+        self._endpoints = {cat: list(eps.keys()) for cat, eps in ENDPOINTS.items()}
+        self._endpoint_choices = {cat: [str(i) for i in range(1, len(eps)+1)]
+                                  for cat, eps in ENDPOINTS.items()}
+        
+    @cached_property
+    def console(self):
+        """Rich console, created on first use"""
+        return Console()
+    
+    def _cache_key(self, url, params):
+        """Stable cache key for a url + params pair"""
+        query = urlencode(sorted((params or {}).items()))
+        return hashlib.blake2b((url + query).encode(), digest_size=16).hexdigest()
+    
+    def _load_cache_meta(self, key):
+        """Load cached validators for a key, or None"""
+        try:
+            with open(self._cache_dir / f"{key}.json") as f:
+                meta = json.load(f)
+            return meta if Path(meta['body_path']).exists() else None
+        except Exception:
+            return None
+    
+    def _store_cache(self, key, response):
+        """Atomically store a 200 response body alongside its validators"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not (etag or last_modified):
+            return
         
-    def make_request(self, url, params=None):
+        body_path = self._cache_dir / f"{key}.body"
+        meta_path = self._cache_dir / f"{key}.json"
+        try:
+            tmp = body_path.with_suffix('.body.part')
+            tmp.write_bytes(response.content)
+            os.replace(tmp, body_path)
+            
+            tmp = meta_path.with_suffix('.json.part')
+            tmp.write_text(json.dumps({'etag': etag, 'last_modified': last_modified,
+                                       'body_path': str(body_path)}))
+            os.replace(tmp, meta_path)
+        except Exception as e:
+            self.console.print(f"[yellow]Could not cache response: {e}[/yellow]")
+    
+    def make_request(self, url, params=None, stream=False):
         """Make API request with rate limiting"""
-        # Simple rate limiting - wait 1 second between requests
-        if self.last_request_time:
-            elapsed = time.time() - self.last_request_time
-            if elapsed < 1:
-                time.sleep(1 - elapsed)
+        # Forget writes that have already landed
+        self._pending_writes = [f for f in self._pending_writes if not f.done()]
+        
+        # Keep requests at least _min_interval apart, only sleeping for whatever
+        # part of the gap hasn't already been spent parsing/prompting
+        now = time.monotonic()
+        delay = self._next_allowed - now
+        if delay > 0:
+            time.sleep(delay)
+        self._next_allowed = max(now, self._next_allowed) + self._min_interval
+        
+        # Send validators from any earlier copy so unchanged resources come back as 304
+        headers = {}
+        meta = None
+        if self.use_cache:
+            key = self._cache_key(url, params)
+            meta = self._load_cache_meta(key)
+            if meta:
+                if meta.get('etag'):
+                    headers['If-None-Match'] = meta['etag']
+                if meta.get('last_modified'):
+                    headers['If-Modified-Since'] = meta['last_modified']
         
         try:
-            response = requests.get(url, auth=self.auth, params=params)
-            self.last_request_time = time.time()
+            response = self.session.get(url, params=params, headers=headers, timeout=(3.05, 30),
+                                        stream=stream)
             self.request_count += 1
             
-            if response.status_code == 429:
-                retry_after = int(response.headers.get('Retry-After', 60))
-                console.print(f"[yellow]Rate limited. Waiting {retry_after} seconds...[/yellow]")
-                time.sleep(retry_after)
-                return self.make_request(url, params)
+            # Not modified - serve the cached body instead of the empty 304
+            if response.status_code == 304 and meta:
+                self.console.print("[dim]304 Not Modified - using cached response[/dim]")
+                response.close()
+                return CachedResponse(Path(meta['body_path']).read_bytes())
             
             response.raise_for_status()
+            # Streamed bodies go straight to disk, so there's nothing held to cache
+            if self.use_cache and not stream:
+                self._store_cache(key, response)
             return response
             
         except requests.exceptions.HTTPError as e:
-            console.print(f"[red]HTTP Error: {e}[/red]")
-            console.print(f"[red]Response: {e.response.text if e.response else 'No response'}[/red]")
+            self.console.print(f"[red]HTTP Error: {e}[/red]")
+            self.console.print(f"[red]Response: {e.response.text if e.response else 'No response'}[/red]")
             raise
         except Exception as e:
-            console.print(f"[red]Error: {e}[/red]")
+            self.console.print(f"[red]Error: {e}[/red]")
             raise
     
     def select_endpoint_category(self):
         """Let user select endpoint category"""
-        console.print(Panel("[bold cyan]Select Endpoint Category[/bold cyan]"))
+        self.console.print(_CAT_PANEL)
         
-        categories = list(ENDPOINTS.keys())
+        categories = self._categories
         for i, cat in enumerate(categories, 1):
-            console.print(f"{i}. {cat}")
+            self.console.print(f"{i}. {cat}")
         
-        choice = Prompt.ask("Select category", choices=[str(i) for i in range(1, len(categories)+1)])
+        choice = Prompt.ask("Select category", choices=self._category_choices)
         return categories[int(choice)-1]
     
     def select_endpoint(self, category):
         """Let user select specific endpoint"""
-        console.print(Panel(f"[bold cyan]Select {category} Endpoint[/bold cyan]"))
+        self.console.print(Panel(f"[bold cyan]Select {category} Endpoint[/bold cyan]"))
         
-        endpoints = list(ENDPOINTS[category].keys())
+        endpoints = self._endpoints[category]
         for i, ep in enumerate(endpoints, 1):
-            ep_info = ENDPOINTS[category][ep]
-            console.print(f"{i}. [green]{ep}[/green] - {ep_info['description']}")
+            self.console.print(f"{i}. [green]{ep}[/green] - {FLAT_ENDPOINTS[ep].description}")
         
-        choice = Prompt.ask("Select endpoint", choices=[str(i) for i in range(1, len(endpoints)+1)])
+        choice = Prompt.ask("Select endpoint", choices=self._endpoint_choices[category])
         return endpoints[int(choice)-1]
     
     def build_url(self, category, endpoint_name):
         """Build URL for endpoint"""
-        endpoint = ENDPOINTS[category][endpoint_name]
-        path = endpoint['path']
-        
-        # Replace placeholders
-        url = self.base_url + path
+        endpoint = FLAT_ENDPOINTS[endpoint_name]
         
-        # Handle season placeholder
-        if '{season}' in url:
-            season = Prompt.ask("Enter season", default=TEST_DATA['season'])
-            url = url.replace('{season}', season)
-        
-        # Handle date placeholder
-        if '{date}' in url:
-            date = Prompt.ask("Enter date (YYYYMMDD)", default=TEST_DATA['date'])
-            url = url.replace('{date}', date)
-        
-        # Handle game placeholder
-        if '{game}' in url:
-            game = Prompt.ask("Enter game ID (YYYYMMDD-AWAY-HOME)", default=TEST_DATA['game'])
-            url = url.replace('{game}', game)
+        # Replace only the placeholders this path actually contains
+        values = {}
+        for ph in endpoint.placeholders:
+            prompt, default_key = _PLACEHOLDER_PROMPTS[ph]
+            values[ph] = Prompt.ask(prompt, default=TEST_DATA[default_key])
+        url = _PLACEHOLDER_RE.sub(lambda m: values[m.group(0)], self.base_url + endpoint.path)
         
         # Add format
         format_type = Prompt.ask("Format", choices=['json', 'xml', 'csv'], default='json')
         url = url + f'.{format_type}'
         
-        return url, endpoint
+        return url, endpoint, format_type
     
     def get_parameters(self, endpoint):
         """Get optional parameters from user"""
         params = {}
         
-        if not endpoint.get('params'):
+        if not endpoint.params:
             return params
         
-        console.print("\n[yellow]Optional Parameters (press Enter to skip):[/yellow]")
+        self.console.print("\n[yellow]Optional Parameters (press Enter to skip):[/yellow]")
         
-        for param, desc in endpoint['params'].items():
+        for param in endpoint.params:
             if param == 'force':
                 continue  # Skip force parameter for simplicity
             
             # Provide helpful prompts based on parameter type
-            if param == 'team':
-                value = Prompt.ask(f"{param} (e.g., MIL or MIL,LAL)", default="")
-            elif param == 'stats':
-                console.print(f"Common stats: {', '.join(COMMON_STATS['team'][:5])}")
-                value = Prompt.ask(f"{param} (comma-separated)", default="")
-            elif param == 'limit':
-                value = Prompt.ask(f"{param} (number)", default="")
-            elif param == 'offset':
-                value = Prompt.ask(f"{param} (number)", default="")
-            else:
-                value = Prompt.ask(f"{param}", default="")
+            prompter = _PARAM_PROMPTERS.get(param)
+            value = prompter(self.console) if prompter else Prompt.ask(f"{param}", default="")
             
             if value:
                 params[param] = value
@@ -165,23 +298,21 @@ class InteractiveAPITester:
         filename = f"{endpoint_name}_{timestamp}.json"
         filepath = self.output_dir / filename
         
-        with open(filepath, 'w') as f:
-            json.dump(response_data, f, indent=2)
+        data = orjson.dumps(response_data, option=orjson.OPT_INDENT_2)
+        self._pending_writes.append(self._io_pool.submit(_write_file, filepath, data))
         
-        console.print(f"\n[green]✅ Response saved to: {filepath}[/green]")
+        self.console.print(f"\n[green]✅ Response saving to: {filepath}[/green]")
         
         # Display summary
-        console.print(Panel("[bold]Response Structure[/bold]"))
+        self.console.print(_STRUCTURE_PANEL)
         
         if isinstance(response_data, dict):
             # Show top-level keys
             table = Table(title="Top-level Keys")
-            table.add_column("Key", style="cyan")
-            table.add_column("Type", style="yellow")
-            table.add_column("Count/Value", style="green")
+            for header, style in _KEY_TABLE_COLUMNS:
+                table.add_column(header, style=style)
             
-            for key in list(response_data.keys())[:10]:  # Limit to first 10 keys
-                value = response_data[key]
+            for key, value in islice(response_data.items(), 10):  # Limit to first 10 keys
                 if isinstance(value, list):
                     count = f"{len(value)} items"
                 elif isinstance(value, dict):
@@ -189,9 +320,9 @@ class InteractiveAPITester:
                 else:
                     count = str(value)[:50]
                 
-                table.add_row(key, type(value).__name__, count)
+                table.add_row(key, _TYPE_NAME.get(type(value), type(value).__name__), count)
             
-            console.print(table)
+            self.console.print(table)
             
             # Show sample data if available
             if 'references' in response_data:
@@ -200,37 +331,47 @@ class InteractiveAPITester:
             # Show first item if it's a list in a data key
             for key in ['games', 'teams', 'players', 'gamelogs', 'standings']:
                 if key in response_data and isinstance(response_data[key], list) and len(response_data[key]) > 0:
-                    console.print(f"\n[cyan]Sample {key} item:[/cyan]")
-                    sample = json.dumps(response_data[key][0], indent=2)[:500]
+                    self.console.print(f"\n[cyan]Sample {key} item:[/cyan]")
+                    sample = orjson.dumps(response_data[key][0], option=orjson.OPT_INDENT_2).decode()[:500]
                     syntax = Syntax(sample, "json", theme="monokai")
-                    console.print(syntax)
+                    self.console.print(syntax)
                     break
     
+    def save_raw_response(self, response, endpoint_name, format_type):
+        """Stream a non-JSON response body to disk"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = self.output_dir / f"{endpoint_name}_{timestamp}.{format_type}"
+        
+        size = 0
+        with open(filepath, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=65536):
+                f.write(chunk)
+                size += len(chunk)
+        
+        self.console.print(f"\n[green]✅ Response saved to: {filepath} ({size:,} bytes)[/green]")
+    
     def show_references(self, references):
         """Show reference data summary"""
-        console.print("\n[cyan]References Summary:[/cyan]")
+        self.console.print("\n[cyan]References Summary:[/cyan]")
         
         for ref_type in ['teamReferences', 'playerReferences', 'gameReferences']:
-            if ref_type in references and references[ref_type]:
-                count = len(references[ref_type])
-                console.print(f"  • {ref_type}: {count} items")
+            refs = references.get(ref_type)
+            if refs:
+                count = len(refs)
+                self.console.print(f"  • {ref_type}: {count} items")
                 if count > 0:
                     # Show first item as example
-                    first_item = references[ref_type][0] if isinstance(references[ref_type], list) else \
-                                 list(references[ref_type].values())[0]
-                    console.print(f"    Example: {json.dumps(first_item, indent=4)[:200]}...")
+                    first_item = refs[0] if isinstance(refs, list) else next(iter(refs.values()))
+                    example = _shallow_preview(first_item).decode()[:200]
+                    self.console.print(f"    Example: {example}...")
     
     def run_interactive_session(self):
         """Run interactive testing session"""
-        console.print(Panel.fit(
-            "[bold magenta]MySportsFeeds API Interactive Tester[/bold magenta]\n"
-            "Explore and test individual endpoints",
-            title="Welcome"
-        ))
+        self.console.print(_WELCOME_PANEL)
         
         # Check credentials
         if not self.api_key:
-            console.print("[red]Error: MSF_API_KEY not found in environment[/red]")
+            self.console.print("[red]Error: MSF_API_KEY not found in environment[/red]")
             return
         
         while True:
@@ -242,13 +383,13 @@ class InteractiveAPITester:
                 endpoint_name = self.select_endpoint(category)
                 
                 # Build URL
-                url, endpoint = self.build_url(category, endpoint_name)
+                url, endpoint, format_type = self.build_url(category, endpoint_name)
                 
                 # Get parameters
                 params = self.get_parameters(endpoint)
                 
                 # Show what we're about to request
-                console.print(Panel(
+                self.console.print(Panel(
                     f"[bold]Request Details[/bold]\n"
                     f"URL: {url}\n"
                     f"Params: {json.dumps(params, indent=2) if params else 'None'}",
@@ -256,42 +397,63 @@ class InteractiveAPITester:
                 ))
                 
                 # Make request
-                console.print("[yellow]Making request...[/yellow]")
-                response = self.make_request(url, params)
-                data = response.json()
-                
-                # Display response
-                self.display_response(data, endpoint_name)
+                self.console.print("[yellow]Making request...[/yellow]")
+                if format_type == 'json':
+                    # Decode straight from the body bytes and drop the response right away,
+                    # so the raw body isn't still alive while display_response re-encodes it
+                    response = self.make_request(url, params)
+                    data = orjson.loads(response.content)
+                    del response
+                    
+                    # Display response
+                    self.display_response(data, endpoint_name)
+                else:
+                    # xml/csv can't be summarized - stream it to disk without decoding
+                    response = self.make_request(url, params, stream=True)
+                    self.save_raw_response(response, endpoint_name, format_type)
                 
                 # Continue?
                 if not Confirm.ask("\nTest another endpoint?"):
                     break
                     
             except KeyboardInterrupt:
-                console.print("\n[yellow]Interrupted by user[/yellow]")
+                self.console.print("\n[yellow]Interrupted by user[/yellow]")
                 break
             except Exception as e:
-                console.print(f"[red]Error: {e}[/red]")
+                self.console.print(f"[red]Error: {e}[/red]")
                 if not Confirm.ask("Continue testing?"):
                     break
         
-        console.print(f"\n[green]Session complete. Total requests: {self.request_count}[/green]")
+        self.flush_writes()
+        self.console.print(f"\n[green]Session complete. Total requests: {self.request_count}[/green]")
+    
+    def flush_writes(self):
+        """Wait for any background response writes to finish"""
+        done, _ = concurrent.futures.wait(self._pending_writes)
+        for future in done:
+            if future.exception():
+                self.console.print(f"[red]Error saving response: {future.exception()}[/red]")
+        self._pending_writes = []
+        self._io_pool.shutdown()
 
 @click.command()
 @click.option('--quick', is_flag=True, help='Run quick test of all endpoints')
 @click.option('--endpoint', help='Test specific endpoint by name')
-def main(quick, endpoint):
+@click.option('--no-cache', is_flag=True, help='Skip the conditional-GET response cache')
+def main(quick, endpoint, no_cache):
     """MySportsFeeds API Interactive Tester"""
-    tester = InteractiveAPITester()
+    tester = InteractiveAPITester(use_cache=not no_cache)
     
     if quick:
-        # Import and run the main explorer
-        from api_explorer import APIExplorer
-        explorer = APIExplorer()
-        explorer.run_all_tests()
+        # Sweep every endpoint through the explorer's async HTTP/2 client,
+        # up to 4 requests in flight under its token-bucket rate limit
+        from api_explorer import SimpleGameAPIExplorer
+        with SimpleGameAPIExplorer(TEST_DATA['game'], max_concurrency=4,
+                                   use_cache=not no_cache) as explorer:
+            explorer.run_all_tests()
     elif endpoint:
         # Test specific endpoint (to be implemented)
-        console.print(f"Testing endpoint: {endpoint}")
+        tester.console.print(f"Testing endpoint: {endpoint}")
     else:
         # Run interactive session
         tester.run_interactive_session()
\ No newline at end of file
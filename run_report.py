@@ -3,7 +3,11 @@
 Runner script for matchup report generator
 """
 import sys
+import argparse
 from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, Future
+from diskcache import Cache
 
 # Add project root to Python path
 project_root = Path(__file__).parent
@@ -12,14 +16,46 @@ sys.path.insert(0, str(project_root))
 from src.reports.matchup_report_generator import MatchupReportGenerator
 from src.data.collectors.game_header import GameHeaderCollector
 
+def _completed(result):
+    """Wrap an already-known section in a finished future"""
+    future = Future()
+    future.set_result(result)
+    return future
+
 if __name__ == "__main__":
-    # Collect data
-    collector = GameHeaderCollector()
-    data = collector.collect('MIL', 'PHI', '20250119')
+    parser = argparse.ArgumentParser(description='Generate a matchup report')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Ignore cached collector output and fetch everything again')
+    args = parser.parse_args()
     
-    # Generate report
+    away, home, date = 'MIL', 'PHI', '20250119'
+    
+    collector = GameHeaderCollector()
     generator = MatchupReportGenerator()
-    report_path = generator.generate_report(data)
+    
+    # Collected sections are cached per game; past games never change, so they
+    # are kept forever while today's/future games expire after an hour. Runs where
+    # a request failed hold fallback values ("0-0", "TBD") and aren't cached at all
+    cache = Cache(str(project_root / '.collector_cache'))
+    key = (away, home, date)
+    parts = None if args.refresh else cache.get(key)
+    
+    # Collect sections in the background while the generator prepares the template
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        if parts is not None:
+            print(f"Using cached data for {away} @ {home} on {date}")
+            futures = [_completed(part) for part in parts]
+        else:
+            futures = list(collector.collect_stream(away, home, date, pool))
+        report_path = generator.generate_report(futures)
+    collector.close()
+    
+    if parts is None and collector.failed_requests:
+        print(f"Not caching collected data: {len(collector.failed_requests)} request(s) failed")
+    elif parts is None:
+        expire = None if date < datetime.now().strftime('%Y%m%d') else 3600
+        cache.set(key, [f.result() for f in futures], expire=expire)
+    cache.close()
     
     print(f"\n✅ Report generated successfully!")
-    print(f"Open in browser: file://{report_path.absolute()}")
\ No newline at end of file
+    print(f"Open in browser: file://{report_path.absolute()}")
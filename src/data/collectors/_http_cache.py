@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Shared MSF Response Cache
+Disk-backed TTL cache for the rolling stats and rankings collectors
+"""
+
+import time
+import hashlib
+from pathlib import Path
+from typing import Dict
+from diskcache import Cache
+
+from src.data.collectors._seasons import response_ttl
+
+CACHE_DIR = Path(__file__).resolve().parents[3] / '.msf_cache' / 'collectors'
+
+# Seconds a response stays fresh while its season is in progress, by endpoint file
+ENDPOINT_TTL = {
+    'standings.json': 60 * 60,
+    'team_stats_totals.json': 60 * 60,
+    'team_gamelogs.json': 60,
+}
+DEFAULT_TTL = 60 * 60
+
+# How long an expired response is kept around to fall back on when MSF returns 429/5xx
+STALE_GRACE = 7 * 24 * 60 * 60
+
+
+def cache_key(endpoint: str, params: Dict = None) -> str:
+    """Stable key for an endpoint + params pair"""
+    raw = f"{endpoint}|{sorted((params or {}).items())}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """Parsed MSF responses on disk, with stale copies kept for rate-limit fallbacks"""
+
+    def __init__(self, directory: Path = CACHE_DIR):
+        self.cache = Cache(str(directory))
+
+    def get(self, endpoint: str, params: Dict = None, allow_stale: bool = False):
+        """Cached response, or None if missing (or expired and allow_stale is off)"""
+        entry = self.cache.get(cache_key(endpoint, params))
+        if entry is None:
+            return None
+        fresh_until, data = entry
+        if fresh_until is None or allow_stale or time.time() < fresh_until:
+            return data
+        return None
+
+    def set(self, endpoint: str, params: Dict, data):
+        """Store a parsed response with its endpoint's TTL"""
+        ttl = response_ttl(endpoint, params, ENDPOINT_TTL.get(endpoint.rsplit('/', 1)[-1], DEFAULT_TTL))
+        if ttl is None:
+            self.cache.set(cache_key(endpoint, params), (None, data))
+        else:
+            self.cache.set(cache_key(endpoint, params), (time.time() + ttl, data), expire=ttl + STALE_GRACE)
+
+    def clear(self):
+        """Drop every cached response"""
+        self.cache.clear()
+
+    def close(self):
+        self.cache.close()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Rolling Window Kernels
+Numeric reductions behind RollingStatsCollector.calculate_windows
+"""
+
+import numpy as np
+
+# Compiled kernel when numba is installed; the NumPy version below is used otherwise
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _reduce_windows_loop(game_matrix, windows, made_cols, att_cols):
+    """Per-window means and shooting percentages (NaN where nothing was attempted)"""
+    num_games, num_cols = game_matrix.shape
+    means = np.zeros((windows.shape[0], num_cols))
+    pcts = np.full((windows.shape[0], made_cols.shape[0]), np.nan)
+    totals = np.zeros(num_cols)
+
+    # Windows are sorted ascending, so each one extends the previous window's totals
+    row = 0
+    for w in range(windows.shape[0]):
+        actual = min(windows[w], num_games)
+        while row < actual:
+            for c in range(num_cols):
+                totals[c] += game_matrix[row, c]
+            row += 1
+        if actual == 0:
+            continue
+        for c in range(num_cols):
+            means[w, c] = totals[c] / actual
+        for p in range(made_cols.shape[0]):
+            att = totals[att_cols[p]]
+            if att > 0:
+                pcts[w, p] = totals[made_cols[p]] / att * 100
+    return means, pcts
+
+
+def _reduce_windows_numpy(game_matrix, windows, made_cols, att_cols):
+    """Per-window means and shooting percentages (NaN where nothing was attempted)"""
+    prefix = np.zeros((game_matrix.shape[0] + 1, game_matrix.shape[1]))
+    np.cumsum(game_matrix, axis=0, out=prefix[1:])
+
+    actual = np.minimum(windows, game_matrix.shape[0])
+    totals = prefix[actual]
+    divisor = np.maximum(actual, 1)[:, None]
+    means = np.where(actual[:, None] > 0, totals / divisor, 0.0)
+
+    made, att = totals[:, made_cols], totals[:, att_cols]
+    pcts = np.full(made.shape, np.nan)
+    np.divide(made, att, out=pcts, where=att > 0)
+    return means, pcts * 100
+
+
+# fastmath is left off: reassociating the sums would change rounded report values
+reduce_windows = (njit(cache=True, nogil=True)(_reduce_windows_loop) if njit is not None
+                  else _reduce_windows_numpy)
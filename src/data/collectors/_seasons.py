@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+MSF Season Helpers
+Season slugs and response expiry shared by every collector
+"""
+
+from functools import lru_cache
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+
+@lru_cache(maxsize=512)
+def season_for_date(date: str) -> str:
+    """Season slug (e.g. 2024-2025-regular) for a YYYYMMDD date, used in endpoint paths"""
+    year = int(date[:4])
+    if int(date[4:6]) >= 10:
+        return f"{year}-{year+1}-regular"
+    return f"{year-1}-{year}-regular"
+
+
+def response_ttl(endpoint: str, params: Dict, ttl: int) -> Optional[int]:
+    """None (never expire) for completed seasons and settled days, ttl otherwise"""
+    # Requests pinned to a day (date/YYYYMMDD/ or date=until-YYYYMMDD) stop changing once
+    # that day's games are final; allow a day's margin for late finishes and stat fixes
+    day = str((params or {}).get('date', ''))
+    if day.startswith('until-'):
+        day = day[6:]
+    elif '/date/' in endpoint:
+        day = endpoint.split('/date/')[1][:8]
+    if day and day < (datetime.now() - timedelta(days=1)).strftime('%Y%m%d'):
+        return None
+
+    try:
+        end_year = int(endpoint.split('/')[0].split('-')[1])
+    except (IndexError, ValueError):
+        return ttl
+    # Regular season and playoffs are over by July of the season's second year
+    return None if datetime.now() >= datetime(end_year, 7, 1) else ttl
@@ -5,111 +5,573 @@ Includes home and away records, streaks, vs conference records, and abbreviation
 """
 
 import os
+import asyncio
+import threading
 import requests
+import httpx
+import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from diskcache import Cache
 from datetime import datetime
-from typing import Dict, Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List, Iterator, Iterable, NamedTuple
+from concurrent.futures import Future, Executor, ThreadPoolExecutor
 from requests.auth import HTTPBasicAuth
 from dotenv import load_dotenv
+from src.data.collectors._seasons import season_for_date as _get_season, response_ttl
+from src.utils.helpers import RateLimiter, retry_after_seconds as _retry_after_seconds
 from pathlib import Path
 import time
+from collections import namedtuple, OrderedDict
+from itertools import groupby
+from operator import attrgetter
+from functools import lru_cache
+from importlib.util import find_spec
+
+# Fast JSON decoding when orjson is installed; accepts the raw response bytes either way
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Optional incremental parser for large league-wide payloads
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional typed decoder for games.json responses
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 load_dotenv()
 
+# On-disk cache of parsed API responses, shared by every collector instance
+CACHE_DIR = Path(__file__).resolve().parents[3] / '.msf_cache'
+CACHE_TTL = 24 * 60 * 60  # Seconds to keep responses for a season still in progress
+
+# Brotli is only advertised when installed, since the clients need it to decode br
+ACCEPT_ENCODING = 'br, gzip, deflate' if find_spec('brotli') else 'gzip, deflate'
+
+# Headers sent on every request; set once on the clients so a reused connection
+# always sees the same ones (HTTP/2 forbids Connection, so only the sync session sends it)
+REQUEST_HEADERS = {'Accept-Encoding': ACCEPT_ENCODING, 'User-Agent': 'athenics/1.0'}
+
+# Responses larger than this on the wire are parsed game by game with ijson
+STREAM_THRESHOLD = 512 * 1024
+
+# Record groups collect() can fetch: standings W-L, the splits tallied from each
+# team's games (conference, division, home/away, vs East/West, recent form, streak)
+# and the season head-to-head
+HEADER_RECORDS = ('overall', 'splits', 'h2h')
+
+# Attempts per async request while MSF answers 429 (the sync session's Retry adapter handles its own)
+MAX_RATE_LIMIT_RETRIES = 3
+
+# Malformed response bodies (json, orjson and msgspec raise ValueError subclasses)
+_PARSE_ERRORS = (ValueError,) if ijson is None else (ValueError, ijson.JSONError)
+
+# API abbreviation to common abbreviation mapping
+API_TO_COMMON = {
+    'BRO': 'BKN',  # Brooklyn Nets
+    'OKL': 'OKC',  # Oklahoma City Thunder
+}
+
+# Common abbreviation to API abbreviation mapping (reverse)
+COMMON_TO_API = {common: api for api, common in API_TO_COMMON.items()}
+
+class TeamInfo(NamedTuple):
+    """Static display and grouping fields for one team"""
+    name: str
+    city: str
+    state: str
+    conf: str
+    div: str
+
+# Team information keyed by COMMON abbreviation (used for display)
+TEAM_INFO = {
+    'ATL': TeamInfo('Hawks', 'Atlanta', 'GA', 'Eastern', 'Southeast'),
+    'BOS': TeamInfo('Celtics', 'Boston', 'MA', 'Eastern', 'Atlantic'),
+    'BKN': TeamInfo('Nets', 'Brooklyn', 'NY', 'Eastern', 'Atlantic'),
+    'CHA': TeamInfo('Hornets', 'Charlotte', 'NC', 'Eastern', 'Southeast'),
+    'CHI': TeamInfo('Bulls', 'Chicago', 'IL', 'Eastern', 'Central'),
+    'CLE': TeamInfo('Cavaliers', 'Cleveland', 'OH', 'Eastern', 'Central'),
+    'DAL': TeamInfo('Mavericks', 'Dallas', 'TX', 'Western', 'Southwest'),
+    'DEN': TeamInfo('Nuggets', 'Denver', 'CO', 'Western', 'Northwest'),
+    'DET': TeamInfo('Pistons', 'Detroit', 'MI', 'Eastern', 'Central'),
+    'GSW': TeamInfo('Warriors', 'Golden State', 'CA', 'Western', 'Pacific'),
+    'HOU': TeamInfo('Rockets', 'Houston', 'TX', 'Western', 'Southwest'),
+    'IND': TeamInfo('Pacers', 'Indiana', 'IN', 'Eastern', 'Central'),
+    'LAC': TeamInfo('Clippers', 'Los Angeles', 'CA', 'Western', 'Pacific'),
+    'LAL': TeamInfo('Lakers', 'Los Angeles', 'CA', 'Western', 'Pacific'),
+    'MEM': TeamInfo('Grizzlies', 'Memphis', 'TN', 'Western', 'Southwest'),
+    'MIA': TeamInfo('Heat', 'Miami', 'FL', 'Eastern', 'Southeast'),
+    'MIL': TeamInfo('Bucks', 'Milwaukee', 'WI', 'Eastern', 'Central'),
+    'MIN': TeamInfo('Timberwolves', 'Minnesota', 'MN', 'Western', 'Northwest'),
+    'NOP': TeamInfo('Pelicans', 'New Orleans', 'LA', 'Western', 'Southwest'),
+    'NYK': TeamInfo('Knicks', 'New York', 'NY', 'Eastern', 'Atlantic'),
+    'OKC': TeamInfo('Thunder', 'Oklahoma City', 'OK', 'Western', 'Northwest'),
+    'ORL': TeamInfo('Magic', 'Orlando', 'FL', 'Eastern', 'Southeast'),
+    'PHI': TeamInfo('76ers', 'Philadelphia', 'PA', 'Eastern', 'Atlantic'),
+    'PHX': TeamInfo('Suns', 'Phoenix', 'AZ', 'Western', 'Pacific'),
+    'POR': TeamInfo('Trail Blazers', 'Portland', 'OR', 'Western', 'Northwest'),
+    'SAC': TeamInfo('Kings', 'Sacramento', 'CA', 'Western', 'Pacific'),
+    'SAS': TeamInfo('Spurs', 'San Antonio', 'TX', 'Western', 'Southwest'),
+    'TOR': TeamInfo('Raptors', 'Toronto', 'ON', 'Eastern', 'Atlantic'),
+    'UTA': TeamInfo('Jazz', 'Utah', 'UT', 'Western', 'Northwest'),
+    'WAS': TeamInfo('Wizards', 'Washington', 'DC', 'Eastern', 'Southeast')
+}
+
+# Same info reachable by either abbreviation, so API codes need no conversion first
+TEAM_INFO_BY_ANY_ABBR = dict(TEAM_INFO)
+for _api, _common in API_TO_COMMON.items():
+    TEAM_INFO_BY_ANY_ABBR[_api] = TEAM_INFO[_common]
+
+# Games are canonicalized to API abbreviations at ingest, so the membership
+# sets below only need one spelling per team
+TEAM_INFO_BY_API = {COMMON_TO_API.get(abbr, abbr): info for abbr, info in TEAM_INFO.items()}
+
+# Conference and division membership for O(1) opponent checks
+EASTERN_TEAMS = frozenset(abbr for abbr, info in TEAM_INFO_BY_API.items() if info.conf == 'Eastern')
+WESTERN_TEAMS = frozenset(abbr for abbr, info in TEAM_INFO_BY_API.items() if info.conf == 'Western')
+CONFERENCE_TEAMS = {'Eastern': EASTERN_TEAMS, 'Western': WESTERN_TEAMS}
+DIVISION_TEAMS = {
+    div: frozenset(abbr for abbr, info in TEAM_INFO_BY_API.items() if info.div == div)
+    for div in {info.div for info in TEAM_INFO.values()}
+}
+
+# Conference (low 2 bits) and division (higher bits) packed into one small code per
+# team, so a single lookup pass classifies every opponent; 0 means unknown team
+_CONF_CODE = {'Eastern': 1, 'Western': 2}
+_DIV_CODE = {div: i for i, div in enumerate(sorted(DIVISION_TEAMS), start=1)}
+_TEAM_CODE = {abbr: _CONF_CODE[info.conf] | _DIV_CODE[info.div] << 2
+              for abbr, info in TEAM_INFO_BY_API.items()}
+
+# Stand-in for abbreviations missing from TEAM_INFO (e.g. MSF's All-Star squads)
+_UNKNOWN_TEAM = TeamInfo('', '', '', '', '')
+
+MONTH_NAMES = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+               'August', 'September', 'October', 'November', 'December')
+
+@lru_cache(maxsize=None)
+def _format_date(date: str) -> str:
+    """YYYYMMDD -> 'January 19, 2025' without strptime/strftime (ValueError if invalid)"""
+    if len(date) == 8 and date.isdigit():
+        month, day = int(date[4:6]), int(date[6:8])
+        if 1 <= month <= 12 and 1 <= day <= 28:
+            return f"{MONTH_NAMES[month - 1]} {date[6:8]}, {date[:4]}"
+    # Month ends and anything unusual go through the full parser for validation
+    return datetime.strptime(date, '%Y%m%d').strftime('%B %d, %Y')
+
+def _format_start_time(start_time: str) -> str:
+    """ISO startTime -> '7:30 PM EST' style display string"""
+    time_obj = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+    hour12 = time_obj.hour % 12 or 12
+    return f"{hour12}:{time_obj.minute:02d} {'AM' if time_obj.hour < 12 else 'PM'} EST"
+
+# Flattened completed game: team abbreviations, final scores and YYYYMMDD date as an int (0 if unknown)
+Game = namedtuple('Game', 'away home away_score home_score date')
+
+def _start_date(start_time: Optional[str]) -> int:
+    """YYYYMMDD int from a schedule startTime (ISO 8601, UTC), 0 if missing"""
+    # schedule.id is a numeric game id, so the start time is the only date on a game
+    digits = (start_time or '')[:10].replace('-', '')
+    return int(digits) if len(digits) == 8 and digits.isdigit() else 0
+
+def _parse_games(data: Optional[Dict]) -> List[Game]:
+    """Flatten a games.json response into Game tuples, keeping only completed games"""
+    if not data or 'games' not in data:
+        return []
+    return _completed_games(data['games'])
+
+def _completed_games(raw_games: Iterable[Dict]) -> List[Game]:
+    """Game tuples for the completed entries of an iterable of game dicts"""
+    games = []
+    canon = COMMON_TO_API.get
+    for game in raw_games:
+        schedule = game.get('schedule', {})
+        score = game.get('score')
+        
+        # Only count completed games
+        if not score or schedule.get('playedStatus') != 'COMPLETED':
+            continue
+        
+        away = schedule.get('awayTeam', {}).get('abbreviation')
+        home = schedule.get('homeTeam', {}).get('abbreviation')
+        games.append(Game(
+            canon(away, away),
+            canon(home, home),
+            score.get('awayScoreTotal', 0),
+            score.get('homeScoreTotal', 0),
+            _start_date(schedule.get('startTime'))
+        ))
+    return games
+
+# Typed shape of the games.json fields we read; everything else is skipped while decoding
+if msgspec is not None:
+    class _MsfTeam(msgspec.Struct):
+        abbreviation: Optional[str] = None
+    
+    class _MsfSchedule(msgspec.Struct):
+        startTime: Optional[str] = None
+        playedStatus: Optional[str] = None
+        awayTeam: Optional[_MsfTeam] = None
+        homeTeam: Optional[_MsfTeam] = None
+    
+    class _MsfScore(msgspec.Struct):
+        awayScoreTotal: Optional[int] = 0
+        homeScoreTotal: Optional[int] = 0
+    
+    class _MsfGame(msgspec.Struct):
+        schedule: _MsfSchedule
+        score: Optional[_MsfScore] = None
+    
+    class _MsfGames(msgspec.Struct):
+        games: List[_MsfGame] = []
+    
+    _GAMES_DECODER = msgspec.json.Decoder(_MsfGames)
+else:
+    _GAMES_DECODER = None
+
+def _decode_games(content: bytes) -> List[Game]:
+    """Completed Game tuples straight from a games.json body via the msgspec decoder"""
+    games = []
+    canon = COMMON_TO_API.get
+    for game in _GAMES_DECODER.decode(content).games:
+        schedule, score = game.schedule, game.score
+        
+        # Only count completed games
+        if score is None or schedule.playedStatus != 'COMPLETED':
+            continue
+        
+        away = schedule.awayTeam.abbreviation if schedule.awayTeam else None
+        home = schedule.homeTeam.abbreviation if schedule.homeTeam else None
+        games.append(Game(
+            canon(away, away),
+            canon(home, home),
+            score.awayScoreTotal,
+            score.homeScoreTotal,
+            _start_date(schedule.startTime)
+        ))
+    return games
+
+def _games_from_body(content: bytes) -> List[Game]:
+    """Completed Game tuples from a games.json body, via msgspec when installed"""
+    if _GAMES_DECODER is not None:
+        return _decode_games(content)
+    return _parse_games(_json_loads(content))
+
+def _when_done(build, *futures: Future) -> Future:
+    """Future resolving to build(*results) once every input future finishes, without holding a pool worker"""
+    combined = Future()
+    remaining = [len(futures)]
+    lock = threading.Lock()
+    
+    def on_done(_):
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        try:
+            combined.set_result(build(*(future.result() for future in futures)))
+        except Exception as e:
+            combined.set_exception(e)
+    
+    for future in futures:
+        future.add_done_callback(on_done)
+    return combined
+
+# In-process LRU of parsed responses shared by every collector instance, so a slate
+# reuses standings/games already loaded without going back to disk
+RESPONSE_MEMO_SIZE = 512
+_response_memo = OrderedDict()  # cache key -> (fresh-until epoch seconds or None, parsed response)
+_memo_lock = threading.Lock()
+
+def _memo_store(key: str, data, fresh_until: Optional[float]):
+    """Add a parsed response to the in-process LRU, evicting the oldest past the limit"""
+    with _memo_lock:
+        _response_memo[key] = (fresh_until, data)
+        _response_memo.move_to_end(key)
+        if len(_response_memo) > RESPONSE_MEMO_SIZE:
+            _response_memo.popitem(last=False)
+
+def _memo_get(key: str):
+    """Memoized response for key, or None if missing or past its disk-cache expiry"""
+    with _memo_lock:
+        entry = _response_memo.get(key)
+        if entry is None:
+            return None
+        fresh_until, data = entry
+        # Same expiry as the disk entry, so a long-running process drops in-progress data too
+        if fresh_until is not None and time.time() >= fresh_until:
+            del _response_memo[key]
+            return None
+        _response_memo.move_to_end(key)
+        return data
+
+class SeasonGamesCache:
+    """
+    Every completed league game in a season up to a date, fetched once per process
+    
+    One league-wide request is several times the bytes of a single team's schedule, but
+    it replaces every per-team games fetch across a slate, so it is opt-in
+    (GameHeaderCollector(season_wide=True)) for multi-game runs.
+    """
+    _seasons = {}  # (season, date) -> SeasonGamesCache
+    _lock = threading.Lock()
+    
+    def __init__(self, games: List[Game]):
+        # Each game is listed under both of its teams
+        self.by_team = {}
+        for game in games:
+            self.by_team.setdefault(game.away, []).append(game)
+            self.by_team.setdefault(game.home, []).append(game)
+    
+    def games_for_team(self, team: str) -> List[Game]:
+        """Completed games team played in"""
+        return self.by_team.get(team, [])
+    
+    @classmethod
+    def get(cls, season: str, date: str, fetch_games) -> Optional['SeasonGamesCache']:
+        """Shared cache for (season, date), fetching it through fetch_games on first use"""
+        key = (season, date)
+        # Held across the fetch so concurrent callers wait for one request instead of racing
+        with cls._lock:
+            if key not in cls._seasons:
+                games = fetch_games(f"{season}/games.json", {'date': f'until-{date}', 'status': 'final'})
+                if games is None:
+                    return None
+                cls._seasons[key] = cls(games)
+            return cls._seasons[key]
+
 class GameHeaderCollector:
     """Collects data for the game header section with enhanced home/away statistics"""
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True, season_wide: bool = False):
         self.api_key = os.getenv('MSF_API_KEY')
         self.password = os.getenv('MSF_PASSWORD', 'MYSPORTSFEEDS')
         self.base_url = 'https://api.mysportsfeeds.com/v2.1/pull/nba'
         self.auth = HTTPBasicAuth(self.api_key, self.password)
         
+        # Keep-alive session so sync requests reuse one pooled TLS connection
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.headers.update({**REQUEST_HEADERS, 'Connection': 'keep-alive'})
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=10, pool_maxsize=20,
+            max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                              allowed_methods=frozenset(['GET']), respect_retry_after_header=True)))
+        
+        # Shared request budget for every request path (MSF allows a couple of calls a second)
+        self.limiter = RateLimiter(rate=2.0)
+        
+        # Finished seasons never change, so their responses are kept indefinitely
+        self.cache = Cache(str(CACHE_DIR)) if use_cache else None
+        
         # API abbreviation to common abbreviation mapping
-        self.api_to_common = {
-            'BRO': 'BKN',  # Brooklyn Nets
-            'OKL': 'OKC',  # Oklahoma City Thunder
-        }
+        self.api_to_common = API_TO_COMMON
         
         # Common abbreviation to API abbreviation mapping (reverse)
-        self.common_to_api = {
-            'BKN': 'BRO',  # Brooklyn Nets
-            'OKC': 'OKL',  # Oklahoma City Thunder
-        }
+        self.common_to_api = COMMON_TO_API
         
-        # Team information mapping (using COMMON abbreviations for display)
-        self.team_info = {
-            'ATL': {'name': 'Hawks', 'city': 'Atlanta', 'state': 'GA', 'conf': 'Eastern', 'div': 'Southeast'},
-            'BOS': {'name': 'Celtics', 'city': 'Boston', 'state': 'MA', 'conf': 'Eastern', 'div': 'Atlantic'},
-            'BKN': {'name': 'Nets', 'city': 'Brooklyn', 'state': 'NY', 'conf': 'Eastern', 'div': 'Atlantic'},  # Common abbreviation
-            'CHA': {'name': 'Hornets', 'city': 'Charlotte', 'state': 'NC', 'conf': 'Eastern', 'div': 'Southeast'},
-            'CHI': {'name': 'Bulls', 'city': 'Chicago', 'state': 'IL', 'conf': 'Eastern', 'div': 'Central'},
-            'CLE': {'name': 'Cavaliers', 'city': 'Cleveland', 'state': 'OH', 'conf': 'Eastern', 'div': 'Central'},
-            'DAL': {'name': 'Mavericks', 'city': 'Dallas', 'state': 'TX', 'conf': 'Western', 'div': 'Southwest'},
-            'DEN': {'name': 'Nuggets', 'city': 'Denver', 'state': 'CO', 'conf': 'Western', 'div': 'Northwest'},
-            'DET': {'name': 'Pistons', 'city': 'Detroit', 'state': 'MI', 'conf': 'Eastern', 'div': 'Central'},
-            'GSW': {'name': 'Warriors', 'city': 'Golden State', 'state': 'CA', 'conf': 'Western', 'div': 'Pacific'},
-            'HOU': {'name': 'Rockets', 'city': 'Houston', 'state': 'TX', 'conf': 'Western', 'div': 'Southwest'},
-            'IND': {'name': 'Pacers', 'city': 'Indiana', 'state': 'IN', 'conf': 'Eastern', 'div': 'Central'},
-            'LAC': {'name': 'Clippers', 'city': 'Los Angeles', 'state': 'CA', 'conf': 'Western', 'div': 'Pacific'},
-            'LAL': {'name': 'Lakers', 'city': 'Los Angeles', 'state': 'CA', 'conf': 'Western', 'div': 'Pacific'},
-            'MEM': {'name': 'Grizzlies', 'city': 'Memphis', 'state': 'TN', 'conf': 'Western', 'div': 'Southwest'},
-            'MIA': {'name': 'Heat', 'city': 'Miami', 'state': 'FL', 'conf': 'Eastern', 'div': 'Southeast'},
-            'MIL': {'name': 'Bucks', 'city': 'Milwaukee', 'state': 'WI', 'conf': 'Eastern', 'div': 'Central'},
-            'MIN': {'name': 'Timberwolves', 'city': 'Minnesota', 'state': 'MN', 'conf': 'Western', 'div': 'Northwest'},
-            'NOP': {'name': 'Pelicans', 'city': 'New Orleans', 'state': 'LA', 'conf': 'Western', 'div': 'Southwest'},
-            'NYK': {'name': 'Knicks', 'city': 'New York', 'state': 'NY', 'conf': 'Eastern', 'div': 'Atlantic'},
-            'OKC': {'name': 'Thunder', 'city': 'Oklahoma City', 'state': 'OK', 'conf': 'Western', 'div': 'Northwest'},  # Common abbreviation
-            'ORL': {'name': 'Magic', 'city': 'Orlando', 'state': 'FL', 'conf': 'Eastern', 'div': 'Southeast'},
-            'PHI': {'name': '76ers', 'city': 'Philadelphia', 'state': 'PA', 'conf': 'Eastern', 'div': 'Atlantic'},
-            'PHX': {'name': 'Suns', 'city': 'Phoenix', 'state': 'AZ', 'conf': 'Western', 'div': 'Pacific'},
-            'POR': {'name': 'Trail Blazers', 'city': 'Portland', 'state': 'OR', 'conf': 'Western', 'div': 'Northwest'},
-            'SAC': {'name': 'Kings', 'city': 'Sacramento', 'state': 'CA', 'conf': 'Western', 'div': 'Pacific'},
-            'SAS': {'name': 'Spurs', 'city': 'San Antonio', 'state': 'TX', 'conf': 'Western', 'div': 'Southwest'},
-            'TOR': {'name': 'Raptors', 'city': 'Toronto', 'state': 'ON', 'conf': 'Eastern', 'div': 'Atlantic'},
-            'UTA': {'name': 'Jazz', 'city': 'Utah', 'state': 'UT', 'conf': 'Western', 'div': 'Northwest'},
-            'WAS': {'name': 'Wizards', 'city': 'Washington', 'state': 'DC', 'conf': 'Eastern', 'div': 'Southeast'},
-            # Keep API abbreviations as fallbacks for internal lookups
-            'BRO': {'name': 'Nets', 'city': 'Brooklyn', 'state': 'NY', 'conf': 'Eastern', 'div': 'Atlantic'},
-            'OKL': {'name': 'Thunder', 'city': 'Oklahoma City', 'state': 'OK', 'conf': 'Western', 'div': 'Northwest'}
-        }
+        # Team information mapping (common and API abbreviations both resolve)
+        self.team_info = TEAM_INFO_BY_ANY_ABBR
+        
+        # Per-instance memos shared across collect() calls, so a slate that reuses one
+        # collector fetches each team's games and standings only once
+        self._team_games_cache = {}  # (team, season, date) -> completed games
+        self._record_cache = {}      # (team, season) -> overall W-L
+        
+        # Slice team games out of one league-wide fetch (see SeasonGamesCache)
+        self.season_wide = season_wide
+        
+        # Endpoints whose requests failed, so callers can tell a section holds fallback values
+        self.failed_requests = []
+    
+    def close(self):
+        """Release pooled connections and the disk cache handle"""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
     
-    def _convert_to_common_abbr(self, api_abbr: str) -> str:
+    @staticmethod
+    def _convert_to_common_abbr(api_abbr: str) -> str:
         """Convert API abbreviation to common abbreviation"""
-        return self.api_to_common.get(api_abbr, api_abbr)
+        return API_TO_COMMON.get(api_abbr, api_abbr)
     
-    def _convert_to_api_abbr(self, common_abbr: str) -> str:
+    @staticmethod
+    def _convert_to_api_abbr(common_abbr: str) -> str:
         """Convert common abbreviation to API abbreviation"""
-        return self.common_to_api.get(common_abbr, common_abbr)
+        return COMMON_TO_API.get(common_abbr, common_abbr)
     
-    def _get_season(self, date: str) -> str:
-        """Determine season from date"""
-        year = int(date[:4])
-        month = int(date[4:6])
-        if month >= 10:
-            return f"{year}-{year+1}-regular"
-        else:
-            return f"{year-1}-{year}-regular"
+    _get_season = staticmethod(_get_season)
+    
+    def _cache_key(self, endpoint: str, params: Dict = None) -> str:
+        """Cache key for an endpoint + params pair"""
+        query = '&'.join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        return f"{endpoint}?{query}"
+    
+    def _cache_expiry(self, endpoint: str, params: Dict = None) -> Optional[int]:
+        """None (never expire) for completed seasons and settled days, CACHE_TTL otherwise"""
+        return response_ttl(endpoint, params, CACHE_TTL)
+    
+    def _cache_get(self, endpoint: str, params: Dict = None, prefix: str = ''):
+        """Cached response for endpoint + params, or None (in-process memo first, then disk)"""
+        if self.cache is None:
+            return None
+        key = prefix + self._cache_key(endpoint, params)
+        data = _memo_get(key)
+        if data is not None:
+            return data
+        
+        data, fresh_until = self.cache.get(key, expire_time=True)
+        if data is not None:
+            _memo_store(key, data, fresh_until)
+        return data
+    
+    def _cache_set(self, endpoint: str, params: Dict, data, prefix: str = ''):
+        """Store a parsed response in the in-process memo and on disk"""
+        if self.cache is not None:
+            key = prefix + self._cache_key(endpoint, params)
+            expiry = self._cache_expiry(endpoint, params)
+            _memo_store(key, data, None if expiry is None else time.time() + expiry)
+            self.cache.set(key, data, expire=expiry)
+    
+    def clear_cache(self):
+        """
+        Drop in-process memos (shared response memo, this collector's records and the
+        season games cache), e.g. before re-running a slate for today while games finish
+        
+        The on-disk cache is left alone; its TTLs already cover in-progress days.
+        """
+        with _memo_lock:
+            _response_memo.clear()
+        with SeasonGamesCache._lock:
+            SeasonGamesCache._seasons.clear()
+        self._team_games_cache.clear()
+        self._record_cache.clear()
     
     def _make_request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
         """Make API request with rate limiting"""
+        cached = self._cache_get(endpoint, params)
+        if cached is not None:
+            return cached
+        
         url = f"{self.base_url}/{endpoint}"
         try:
-            time.sleep(0.5)  # Be nice to the API
-            response = requests.get(url, auth=self.auth, params=params)
+            self.limiter.acquire()  # Be nice to the API
+            response = self.session.get(url, params=params, timeout=(3.05, 30))
             response.raise_for_status()
-            return response.json()
-        except Exception as e:
+            data = _json_loads(response.content)
+        except (requests.RequestException, ValueError) as e:
             print(f"Error fetching {endpoint}: {e}")
+            self.failed_requests.append(endpoint)
             return None
+        
+        self._cache_set(endpoint, params, data)
+        return data
     
-    def get_game_info(self, away_team: str, home_team: str, date: str) -> Dict:
-        """Get basic game information"""
-        season = self._get_season(date)
-        endpoint = f"{season}/date/{date}/games.json"
-        params = {'team': f"{away_team},{home_team}"}
+    def _fetch_games(self, endpoint: str, params: Dict = None) -> Optional[List[Game]]:
+        """
+        Completed games for a games.json request, or None on failure
+        
+        Large responses are parsed incrementally with ijson and the rest are decoded into
+        typed structs with msgspec (each when installed), so the full dict tree is never
+        built; the parsed games are cached rather than the raw response.
+        """
+        cached = self._cache_get(endpoint, params, prefix='games:')
+        if cached is not None:
+            return cached
+        
+        url = f"{self.base_url}/{endpoint}"
+        try:
+            self.limiter.acquire()  # Be nice to the API
+            with self.session.get(url, params=params, timeout=(3.05, 30), stream=True) as response:
+                response.raise_for_status()
+                if ijson is not None and int(response.headers.get('Content-Length', 0)) > STREAM_THRESHOLD:
+                    response.raw.decode_content = True
+                    games = _completed_games(ijson.items(response.raw, 'games.item'))
+                else:
+                    games = _games_from_body(response.content)
+        except (requests.RequestException, *_PARSE_ERRORS) as e:
+            print(f"Error fetching {endpoint}: {e}")
+            self.failed_requests.append(endpoint)
+            return None
         
-        data = self._make_request(endpoint, params)
+        self._cache_set(endpoint, params, games, prefix='games:')
+        return games
+    
+    async def _get_async(self, client: httpx.AsyncClient, endpoint: str,
+                         params: Dict = None) -> httpx.Response:
+        """GET on the async client, paced by the shared token bucket and waiting out 429s"""
+        url = f"{self.base_url}/{endpoint}"
+        for _ in range(MAX_RATE_LIMIT_RETRIES):
+            await self.limiter.acquire_async()
+            response = await client.get(url, params=params)
+            if response.status_code != 429:
+                break
+            # Over quota: hold back every request, not just this one, for as long as asked
+            self.limiter.pause(_retry_after_seconds(response.headers.get('Retry-After')))
+        response.raise_for_status()
+        return response
+    
+    async def _make_request_async(self, client: httpx.AsyncClient, endpoint: str,
+                                  params: Dict = None) -> Optional[Dict]:
+        """Make API request on the async client, paced by the shared token bucket"""
+        cached = self._cache_get(endpoint, params)
+        if cached is not None:
+            return cached
         
+        try:
+            response = await self._get_async(client, endpoint, params)
+            data = _json_loads(response.content)
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"Error fetching {endpoint}: {e}")
+            self.failed_requests.append(endpoint)
+            return None
+        
+        self._cache_set(endpoint, params, data)
+        return data
+    
+    async def _fetch_games_async(self, client: httpx.AsyncClient, endpoint: str,
+                                 params: Dict = None) -> Optional[List[Game]]:
+        """Async _fetch_games(), caching the parsed games under the same 'games:' key"""
+        cached = self._cache_get(endpoint, params, prefix='games:')
+        if cached is not None:
+            return cached
+        
+        # httpx has already read the body, so there's nothing for ijson to stream
+        try:
+            response = await self._get_async(client, endpoint, params)
+            games = _games_from_body(response.content)
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"Error fetching {endpoint}: {e}")
+            self.failed_requests.append(endpoint)
+            return None
+        
+        self._cache_set(endpoint, params, games, prefix='games:')
+        return games
+    
+    def _game_info_request(self, away_team: str, home_team: str, date: str) -> Tuple[str, Dict]:
+        """Endpoint and params for the day's games involving both teams"""
+        season = _get_season(date)
+        return f"{season}/date/{date}/games.json", {'team': f"{away_team},{home_team}"}
+    
+    def get_game_info(self, away_team: str, home_team: str, date: str) -> Dict:
+        """Get basic game information"""
+        data = self._make_request(*self._game_info_request(away_team, home_team, date))
+        return self._parse_game_info(data, away_team, home_team, date)
+    
+    def _parse_game_info(self, data: Optional[Dict], away_team: str, home_team: str, date: str) -> Dict:
+        """Pull date/time/venue for the matchup out of a daily games response"""
         if data and 'games' in data:
             for game in data['games']:
                 schedule = game.get('schedule', {})
@@ -118,15 +580,13 @@ class GameHeaderCollector:
                 
                 if away == away_team and home == home_team:
                     # Format date for display
-                    date_obj = datetime.strptime(date, '%Y%m%d')
-                    formatted_date = date_obj.strftime('%B %d, %Y')
+                    formatted_date = _format_date(date)
                     
                     # Format time
                     start_time = schedule.get('startTime', '')
                     if start_time:
                         try:
-                            time_obj = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                            formatted_time = time_obj.strftime('%I:%M %p EST').lstrip('0')
+                            formatted_time = _format_start_time(start_time)
                         except:
                             formatted_time = 'TBD'
                     else:
@@ -141,442 +601,220 @@ class GameHeaderCollector:
         
         # If no game found, still format the date nicely
         try:
-            date_obj = datetime.strptime(date, '%Y%m%d')
-            formatted_date = date_obj.strftime('%B %d, %Y')
+            formatted_date = _format_date(date)
         except:
             formatted_date = date
             
         return {'date': formatted_date, 'time': 'TBD', 'venue': 'TBD', 'city': ''}
     
-    def _calculate_home_away_records(self, team: str, season: str, date: str) -> Tuple[str, str]:
-        """Calculate home and away records for a team"""
-        endpoint = f"{season}/games.json"
-        params = {'team': team}
+    def _fetch_team_games(self, team: str, season: str, date: str) -> List[Game]:
+        """Fetch a team's completed games once, reused by every record calculation"""
+        if self.season_wide:
+            season_games = SeasonGamesCache.get(season, date, self._fetch_games)
+            if season_games is not None:
+                return season_games.games_for_team(team)
         
-        if date and date != '20250119':
-            params['date'] = f'until-{date}'
-        
-        data = self._make_request(endpoint, params)
+        key = (team, season, date)
+        if key in self._team_games_cache:
+            return self._team_games_cache[key]
         
-        home_wins = 0
-        home_losses = 0
-        away_wins = 0
-        away_losses = 0
+        games = self._fetch_games(*self._team_games_request(team, season, date))
         
-        if data and 'games' in data:
-            for game in data['games']:
-                schedule = game.get('schedule', {})
-                score = game.get('score', {})
-                
-                # Only count completed games
-                if not score or schedule.get('playedStatus') != 'COMPLETED':
-                    continue
-                
-                away_team = schedule.get('awayTeam', {}).get('abbreviation')
-                home_team = schedule.get('homeTeam', {}).get('abbreviation')
-                away_score = score.get('awayScoreTotal', 0)
-                home_score = score.get('homeScoreTotal', 0)
-                
-                if away_team == team:
-                    # Team played away
-                    if away_score > home_score:
-                        away_wins += 1
-                    else:
-                        away_losses += 1
-                elif home_team == team:
-                    # Team played at home
-                    if home_score > away_score:
-                        home_wins += 1
-                    else:
-                        home_losses += 1
-        
-        return f"{home_wins}-{home_losses}", f"{away_wins}-{away_losses}"
+        # Don't cache failed fetches so a later call can retry
+        if games is None:
+            return []
+        self._team_games_cache[key] = games
+        return games
     
-    def _calculate_vs_conference_records(self, team: str, season: str, date: str) -> Tuple[str, str]:
-        """Calculate records vs Eastern and Western conferences"""
+    def _team_games_request(self, team: str, season: str, date: str) -> Tuple[str, Dict]:
+        """Endpoint and params for a team's season games up to date"""
         endpoint = f"{season}/games.json"
-        params = {'team': team}
+        # Only finished games are used, so let the API drop the rest
+        params = {'team': team, 'status': 'final'}
         
-        if date and date != '20250119':
+        # Only games up to the report date
+        if date:
             params['date'] = f'until-{date}'
         
-        data = self._make_request(endpoint, params)
+        return endpoint, params
+    
+    def _aggregate_team_games(self, team: str, games: List[Game]) -> Dict:
+        """
+        Tally every record split for team with vectorized masks over its completed games
         
-        eastern_wins = 0
-        eastern_losses = 0
-        western_wins = 0
-        western_losses = 0
+        Returns W/L counters for home, away, vs East/West, conference and division,
+        plus 'results': chronological list of True (win) / False (loss).
+        """
+        team = COMMON_TO_API.get(team, team)
+        info = TEAM_INFO_BY_API.get(team, _UNKNOWN_TEAM)
         
-        if data and 'games' in data:
-            for game in data['games']:
-                schedule = game.get('schedule', {})
-                score = game.get('score', {})
-                
-                # Only count completed games
-                if not score or schedule.get('playedStatus') != 'COMPLETED':
-                    continue
-                
-                away_team = schedule.get('awayTeam', {}).get('abbreviation')
-                home_team = schedule.get('homeTeam', {}).get('abbreviation')
-                
-                # Determine opponent
-                opponent = home_team if away_team == team else away_team
-                # Convert API abbreviation to common for team_info lookup
-                opponent_common = self._convert_to_common_abbr(opponent)
-                opponent_conf = self.team_info.get(opponent_common, {}).get('conf')
-                
-                if not opponent_conf:
-                    # Try with the original abbreviation as fallback
-                    opponent_conf = self.team_info.get(opponent, {}).get('conf')
-                
-                if not opponent_conf:
-                    continue
-                
-                away_score = score.get('awayScoreTotal', 0)
-                home_score = score.get('homeScoreTotal', 0)
-                
-                # Determine if team won
-                team_won = False
-                if away_team == team:
-                    team_won = away_score > home_score
-                else:
-                    team_won = home_score > away_score
-                
-                # Add to appropriate conference record
-                if opponent_conf == 'Eastern':
-                    if team_won:
-                        eastern_wins += 1
-                    else:
-                        eastern_losses += 1
-                elif opponent_conf == 'Western':
-                    if team_won:
-                        western_wins += 1
-                    else:
-                        western_losses += 1
+        # Columns in chronological order so results ends with the latest game
+        ordered = sorted(games, key=attrgetter('date'))
+        away = np.array([g.away for g in ordered], dtype=object)
+        home = np.array([g.home for g in ordered], dtype=object)
+        away_score = np.fromiter((g.away_score for g in ordered), dtype=np.int16, count=len(ordered))
+        home_score = np.fromiter((g.home_score for g in ordered), dtype=np.int16, count=len(ordered))
         
-        return f"{eastern_wins}-{eastern_losses}", f"{western_wins}-{western_losses}"
-    
-    def _calculate_recent_records_and_streak(self, team: str, season: str, date: str) -> Dict[str, str]:
-        """Calculate last 3, 7, 12 games records and current streak"""
-        endpoint = f"{season}/games.json"
-        params = {'team': team}
-        
-        if date and date != '20250119':
-            params['date'] = f'until-{date}'
+        is_away = away == team
+        is_home = ~is_away & (home == team)
+        opponent = np.where(is_away, home, away)
+        won = np.where(is_away, away_score > home_score, home_score > away_score)
         
-        data = self._make_request(endpoint, params)
+        # Classify every opponent in one pass, then split conference and division out of the code
+        team_code = _TEAM_CODE.get
+        opp_code = np.fromiter((team_code(opp, 0) for opp in opponent), dtype=np.int8, count=len(opponent))
+        opp_conf = opp_code & 3
+        opp_east = opp_conf == _CONF_CODE['Eastern']
+        opp_west = opp_conf == _CONF_CODE['Western']
+        same_conf = opp_conf == _CONF_CODE.get(info.conf, -1)
+        same_div = (opp_code >> 2) == _DIV_CODE.get(info.div, -1)
         
-        games_results = []  # List of True (win) or False (loss)
+        # Pack each result as win << 32 | loss so one matrix-vector product tallies all six
+        # splits; wins and losses come back out of the high and low halves
+        packed = np.where(won, np.int64(1 << 32), np.int64(1))
+        masks = np.stack((is_home, is_away, opp_east, opp_west, same_conf, same_div))
+        tallies = masks.astype(np.int64) @ packed
+        (home_w, away_w, east_w, west_w, conf_w, div_w) = (tallies >> 32).tolist()
+        (home_l, away_l, east_l, west_l, conf_l, div_l) = (tallies & 0xFFFFFFFF).tolist()
         
-        if data and 'games' in data:
-            # Sort games by date to get chronological order
-            sorted_games = []
-            for game in data['games']:
-                schedule = game.get('schedule', {})
-                score = game.get('score', {})
-                
-                # Only count completed games
-                if not score or schedule.get('playedStatus') != 'COMPLETED':
-                    continue
-                
-                game_id = schedule.get('id', '')
-                if game_id:
-                    game_date = str(game_id).split('-')[0] if '-' in str(game_id) else ''
-                    sorted_games.append((game_date, game))
-            
-            sorted_games.sort(key=lambda x: x[0])
-            
-            # Process games in chronological order
-            for _, game in sorted_games:
-                schedule = game['schedule']
-                score = game['score']
-                
-                away_team = schedule.get('awayTeam', {}).get('abbreviation')
-                home_team = schedule.get('homeTeam', {}).get('abbreviation')
-                away_score = score.get('awayScoreTotal', 0)
-                home_score = score.get('homeScoreTotal', 0)
-                
-                if away_team == team:
-                    games_results.append(away_score > home_score)
-                elif home_team == team:
-                    games_results.append(home_score > away_score)
-        
-        # Calculate last 3, 7, and 12
-        last_3_wins = 0
-        last_3_losses = 0
-        last_7_wins = 0
-        last_7_losses = 0
-        last_12_wins = 0
-        last_12_losses = 0
-        
-        if len(games_results) > 0:
-            # Last 3 games
-            last_3_results = games_results[-3:]
-            last_3_wins = sum(last_3_results)
-            last_3_losses = len(last_3_results) - last_3_wins
-            
-            # Last 7 games
-            last_7_results = games_results[-7:]
-            last_7_wins = sum(last_7_results)
-            last_7_losses = len(last_7_results) - last_7_wins
-            
-            # Last 12 games
-            last_12_results = games_results[-12:]
-            last_12_wins = sum(last_12_results)
-            last_12_losses = len(last_12_results) - last_12_wins
+        return {
+            'home_w': home_w, 'home_l': home_l,
+            'away_w': away_w, 'away_l': away_l,
+            'east_w': east_w, 'east_l': east_l,
+            'west_w': west_w, 'west_l': west_l,
+            'conf_w': conf_w, 'conf_l': conf_l,
+            'div_w': div_w, 'div_l': div_l,
+            # Recent form only counts games the team actually played in
+            'results': won[is_away | is_home].tolist()
+        }
+    
+    def _recent_records(self, games_results: List[bool]) -> Dict[str, str]:
+        """Last 3, 7, 12 games records and current streak from chronological results"""
+        # Slice the longest window once; the shorter ones are tails of it
+        tail = games_results[-12:]
+        last_3 = tail[-3:]
+        last_7 = tail[-7:]
+        last_3_wins = sum(last_3)
+        last_7_wins = sum(last_7)
+        last_12_wins = sum(tail)
         
-        # Calculate current streak
+        # Current streak is the first run when reading results newest-first
         streak = ""
-        if len(games_results) > 0:
-            current_result = games_results[-1]
-            streak_count = 1
-            
-            # Count consecutive same results from the end
-            for i in range(len(games_results) - 2, -1, -1):
-                if games_results[i] == current_result:
-                    streak_count += 1
-                else:
-                    break
-            
+        if games_results:
+            current_result, run = next(groupby(reversed(games_results)))
             streak_type = "W" if current_result else "L"
-            streak = f"{streak_type}{streak_count}"
+            streak = f"{streak_type}{sum(1 for _ in run)}"
         
         return {
-            'last_3': f"{last_3_wins}-{last_3_losses}",
-            'last_7': f"{last_7_wins}-{last_7_losses}",
-            'last_12': f"{last_12_wins}-{last_12_losses}",
+            'last_3': f"{last_3_wins}-{len(last_3) - last_3_wins}",
+            'last_7': f"{last_7_wins}-{len(last_7) - last_7_wins}",
+            'last_12': f"{last_12_wins}-{len(tail) - last_12_wins}",
             'streak': streak
         }
     
     def get_team_records(self, team: str, season: str, date: str) -> Dict:
         """Get comprehensive team records including home/away and vs conferences"""
-        # Get overall record from standings
-        overall_record = self._get_overall_record(team, season)
-        
-        # Calculate conference and division records
-        conf_record = self._calculate_conference_record(team, season, date)
-        div_record = self._calculate_division_record(team, season, date)
-        
-        # Calculate home and away records
-        home_record, away_record = self._calculate_home_away_records(team, season, date)
+        # Standings record and the team's completed games (fetched once and shared
+        # across every calculation) are independent requests, so overlap them
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            overall_future = pool.submit(self._get_overall_record, team, season)
+            games_future = pool.submit(self._fetch_team_games, team, season, date)
         
-        # Calculate vs conference records
-        vs_eastern, vs_western = self._calculate_vs_conference_records(team, season, date)
+        return self._build_team_records(team, overall_future.result(), games_future.result())
+    
+    def _build_team_records(self, team: str, overall_record: str, games: List[Game]) -> Dict:
+        """Compute every record split from the standings record and completed games"""
+        return {'overall': overall_record, **self._split_records(team, games)}
+    
+    def _split_records(self, team: str, games: List[Game]) -> Dict:
+        """Conference/division/home/away/vs-conference splits and recent form from completed games"""
+        totals = self._aggregate_team_games(team, games)
         
         # Calculate recent records and streak
-        recent_records = self._calculate_recent_records_and_streak(team, season, date)
+        recent_records = self._recent_records(totals['results'])
         
         return {
-            'overall': overall_record,
-            'conference': conf_record,
-            'division': div_record,
-            'home': home_record,
-            'away': away_record,
-            'vs_eastern': vs_eastern,
-            'vs_western': vs_western,
+            'conference': f"{totals['conf_w']}-{totals['conf_l']}",
+            'division': f"{totals['div_w']}-{totals['div_l']}",
+            'home': f"{totals['home_w']}-{totals['home_l']}",
+            'away': f"{totals['away_w']}-{totals['away_l']}",
+            'vs_eastern': f"{totals['east_w']}-{totals['east_l']}",
+            'vs_western': f"{totals['west_w']}-{totals['west_l']}",
             'last_3': recent_records['last_3'],
             'last_7': recent_records['last_7'],
             'last_12': recent_records['last_12'],
             'streak': recent_records['streak']
         }
     
+    def _standings_request(self, teams: List[str], season: str) -> Tuple[str, Dict]:
+        """Endpoint and params for the standings rows of every team in teams"""
+        # Only wins and losses are read, so skip the rest of the standings stats
+        return f"{season}/standings.json", {'team': ','.join(teams), 'stats': 'W,L'}
+    
     def _get_overall_record(self, team: str, season: str) -> str:
         """Get overall W-L from standings"""
-        endpoint = f"{season}/standings.json"
-        params = {'team': team}
-        
-        data = self._make_request(endpoint, params)
-        
-        if data and 'teams' in data:
-            for team_data in data['teams']:
-                if team_data.get('team', {}).get('abbreviation') == team:
-                    standings = team_data.get('stats', {}).get('standings', {})
-                    wins = standings.get('wins', 0)
-                    losses = standings.get('losses', 0)
-                    return f"{wins}-{losses}"
-        
-        return "0-0"
+        return self._get_overall_records([team], season)[team]
     
-    def _calculate_conference_record(self, team: str, season: str, date: str) -> str:
-        """Calculate conference record by analyzing games"""
-        # Convert to common abbreviation to get conference info
-        team_common = self._convert_to_common_abbr(team)
-        team_conf = self.team_info.get(team_common, {}).get('conf')
-        
-        if not team_conf:
-            # Try with original abbreviation as fallback
-            team_conf = self.team_info.get(team, {}).get('conf')
-        
-        if not team_conf:
-            return "0-0"
-        
-        endpoint = f"{season}/games.json"
-        params = {'team': team}
-        
-        if date and date != '20250119':
-            params['date'] = f'until-{date}'
-        
-        data = self._make_request(endpoint, params)
-        
-        conf_wins = 0
-        conf_losses = 0
-        
-        if data and 'games' in data:
-            for game in data['games']:
-                schedule = game.get('schedule', {})
-                score = game.get('score', {})
-                
-                # Only count completed games
-                if not score or schedule.get('playedStatus') != 'COMPLETED':
-                    continue
-                
-                away_team = schedule.get('awayTeam', {}).get('abbreviation')
-                home_team = schedule.get('homeTeam', {}).get('abbreviation')
-                
-                # Determine opponent
-                opponent = home_team if away_team == team else away_team
-                # Convert to common abbreviation for team_info lookup
-                opponent_common = self._convert_to_common_abbr(opponent)
-                opponent_conf = self.team_info.get(opponent_common, {}).get('conf')
-                
-                if not opponent_conf:
-                    # Try with original abbreviation as fallback
-                    opponent_conf = self.team_info.get(opponent, {}).get('conf')
-                
-                # Only count if opponent is in same conference
-                if opponent_conf == team_conf:
-                    away_score = score.get('awayScoreTotal', 0)
-                    home_score = score.get('homeScoreTotal', 0)
-                    
-                    if away_team == team:
-                        if away_score > home_score:
-                            conf_wins += 1
-                        else:
-                            conf_losses += 1
-                    else:
-                        if home_score > away_score:
-                            conf_wins += 1
-                        else:
-                            conf_losses += 1
-        
-        return f"{conf_wins}-{conf_losses}"
+    def _get_overall_records(self, teams: List[str], season: str) -> Dict[str, str]:
+        """Overall W-L for each team, fetching every unmemoized team in one standings request"""
+        missing = [team for team in teams if (team, season) not in self._record_cache]
+        if missing:
+            data = self._make_request(*self._standings_request(missing, season))
+            self._store_overall_records(missing, season, data)
+        return self._cached_records(teams, season)
     
-    def _calculate_division_record(self, team: str, season: str, date: str) -> str:
-        """Calculate division record by analyzing games"""
-        # Convert to common abbreviation to get division info
-        team_common = self._convert_to_common_abbr(team)
-        team_div = self.team_info.get(team_common, {}).get('div')
-        
-        if not team_div:
-            # Try with original abbreviation as fallback
-            team_div = self.team_info.get(team, {}).get('div')
-        
-        if not team_div:
-            return "0-0"
-        
-        endpoint = f"{season}/games.json"
-        params = {'team': team}
-        
-        if date and date != '20250119':
-            params['date'] = f'until-{date}'
-        
-        data = self._make_request(endpoint, params)
-        
-        div_wins = 0
-        div_losses = 0
-        
-        if data and 'games' in data:
-            for game in data['games']:
-                schedule = game.get('schedule', {})
-                score = game.get('score', {})
-                
-                # Only count completed games
-                if not score or schedule.get('playedStatus') != 'COMPLETED':
-                    continue
-                
-                away_team = schedule.get('awayTeam', {}).get('abbreviation')
-                home_team = schedule.get('homeTeam', {}).get('abbreviation')
-                
-                # Determine opponent
-                opponent = home_team if away_team == team else away_team
-                # Convert to common abbreviation for team_info lookup
-                opponent_common = self._convert_to_common_abbr(opponent)
-                opponent_div = self.team_info.get(opponent_common, {}).get('div')
-                
-                if not opponent_div:
-                    # Try with original abbreviation as fallback
-                    opponent_div = self.team_info.get(opponent, {}).get('div')
-                
-                # Only count if opponent is in same division
-                if opponent_div == team_div:
-                    away_score = score.get('awayScoreTotal', 0)
-                    home_score = score.get('homeScoreTotal', 0)
-                    
-                    if away_team == team:
-                        if away_score > home_score:
-                            div_wins += 1
-                        else:
-                            div_losses += 1
-                    else:
-                        if home_score > away_score:
-                            div_wins += 1
-                        else:
-                            div_losses += 1
-        
-        return f"{div_wins}-{div_losses}"
+    def _store_overall_records(self, teams: List[str], season: str, data: Optional[Dict]):
+        """Parse a standings response and memoize each team's record"""
+        # Don't memoize failed fetches so a later call can retry
+        if data is None:
+            return
+        records = self._parse_overall_records(data)
+        for team in teams:
+            self._record_cache[(team, season)] = records.get(team, "0-0")
+    
+    def _cached_records(self, teams: List[str], season: str) -> Dict[str, str]:
+        """Memoized records for teams, "0-0" for any that couldn't be fetched"""
+        return {team: self._record_cache.get((team, season), "0-0") for team in teams}
+    
+    def _parse_overall_records(self, data: Optional[Dict]) -> Dict[str, str]:
+        """W-L for every team row in a standings response"""
+        records = {}
+        if data and 'teams' in data:
+            for team_data in data['teams']:
+                standings = team_data.get('stats', {}).get('standings', {})
+                wins = standings.get('wins', 0)
+                losses = standings.get('losses', 0)
+                records.setdefault(team_data.get('team', {}).get('abbreviation'), f"{wins}-{losses}")
+        return records
     
     def get_h2h_season_record(self, team_a: str, team_b: str, season: str, date: str) -> str:
         """Get head-to-head record for current season up to the given date"""
-        endpoint = f"{season}/games.json"
-        params = {'team': f"{team_a},{team_b}"}
-        
-        data = self._make_request(endpoint, params)
+        # Every meeting is already in team_a's game list (shared with its records)
+        return self._h2h_record(self._fetch_team_games(team_a, season, date), team_a, team_b)
+    
+    def _h2h_record(self, games: List[Game], team_a: str, team_b: str) -> str:
+        """Count wins for each side in team_a's games against team_b"""
         team_a_wins = 0
         team_b_wins = 0
+        team_b = COMMON_TO_API.get(team_b, team_b)
         
-        if data and 'games' in data:
-            for game in data['games']:
-                schedule = game.get('schedule', {})
-                away = schedule.get('awayTeam', {}).get('abbreviation')
-                home = schedule.get('homeTeam', {}).get('abbreviation')
-                
-                # Only count games between these two teams
-                if {away, home} != {team_a, team_b}:
-                    continue
-                
-                # Only count completed games before or on the given date
-                score = game.get('score', {})
-                if not score or schedule.get('playedStatus') != 'COMPLETED':
-                    continue
-                
-                # Check if game date is before our target date
-                game_id = schedule.get('id', '')
-                if game_id:
-                    game_id_str = str(game_id)
-                    if '-' in game_id_str:
-                        parts = game_id_str.split('-')
-                        if len(parts) > 0:
-                            game_date = parts[0]
-                            if game_date and game_date > date:
-                                continue
-                
-                away_score = score.get('awayScoreTotal', 0)
-                home_score = score.get('homeScoreTotal', 0)
-                
-                if away_score > home_score:
-                    if away == team_a:
-                        team_a_wins += 1
-                    else:
-                        team_b_wins += 1
-                else:
-                    if home == team_a:
-                        team_a_wins += 1
-                    else:
-                        team_b_wins += 1
+        # games are team_a's completed games up to the report date, so a game is a
+        # meeting exactly when team_b is on one side; no per-game pair/set is built
+        for away, home, away_score, home_score, _ in games:
+            if away == team_b:
+                team_b_won = away_score > home_score
+            elif home == team_b:
+                team_b_won = not away_score > home_score
+            else:
+                continue
+            
+            team_b_wins += team_b_won
+            team_a_wins += not team_b_won
         
         return f"{team_a_wins}-{team_b_wins}"
     
-    def collect(self, away_team: str, home_team: str, date: str) -> Dict:
+    def collect(self, away_team: str, home_team: str, date: str,
+                include: Iterable[str] = HEADER_RECORDS) -> Dict:
         """
         Collect all header section data with enhanced statistics
         
@@ -584,71 +822,221 @@ class GameHeaderCollector:
             away_team: Away team abbreviation (can be common or API format)
             home_team: Home team abbreviation (can be common or API format)
             date: Date in YYYYMMDD format
+            include: Which records to collect (see HEADER_RECORDS); requests only
+                needed by the others are skipped and their keys left out
         
         Returns complete data for the game header section including home/away records
         """
+        include = frozenset(include)
+        to_api, to_common = COMMON_TO_API.get, API_TO_COMMON.get
+        
         # Convert to API abbreviations for API calls
-        away_api = self._convert_to_api_abbr(away_team)
-        home_api = self._convert_to_api_abbr(home_team)
+        away_api = to_api(away_team, away_team)
+        home_api = to_api(home_team, home_team)
         
         # Convert to common abbreviations for display
-        away_common = self._convert_to_common_abbr(away_api)
-        home_common = self._convert_to_common_abbr(home_api)
+        away_common = to_common(away_api, away_api)
+        home_common = to_common(home_api, home_api)
         
         print(f"Collecting game header for {away_common} @ {home_common} on {date}")
         
-        season = self._get_season(date)
-        
-        # Use API abbreviations for API calls
-        game_info = self.get_game_info(away_api, home_api, date)
-        
-        # Get team information using common abbreviations
-        away_info = self.team_info.get(away_common, {})
-        home_info = self.team_info.get(home_common, {})
+        season = _get_season(date)
         
         print("Getting comprehensive team records (this may take a moment)...")
-        # Get all records using API abbreviations
-        away_records = self.get_team_records(away_api, season, date)
-        home_records = self.get_team_records(home_api, season, date)
+        # Every request is independent, so issue them all at once; the shared
+        # token bucket keeps the combined request rate within the API limit
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            game_info_future = pool.submit(self._game_info_section, away_api, home_api, date)
+            overall = (pool.submit(self._get_overall_records, [away_api, home_api], season)
+                       if 'overall' in include else None)
+            # Head-to-head comes from the away team's games instead of another request
+            away_games = (pool.submit(self._fetch_team_games, away_api, season, date)
+                          if include & {'splits', 'h2h'} else None)
+            home_games = (pool.submit(self._fetch_team_games, home_api, season, date)
+                          if 'splits' in include else None)
         
-        # Get H2H record using API abbreviations
-        h2h_record = self.get_h2h_season_record(away_api, home_api, season, date)
+        data = {**game_info_future.result()}
+        for side, team, common, games in (('away_team', away_api, away_common, away_games),
+                                          ('home_team', home_api, home_common, home_games)):
+            records = {}
+            if overall is not None:
+                records['overall'] = overall.result()[team]
+            if 'splits' in include:
+                records.update(self._split_records(team, games.result()))
+            data[side] = {**self._team_section(common), 'records': records}
         
+        if 'h2h' in include:
+            data['h2h_season_record'] = self._h2h_record(away_games.result(), away_api, home_api)
+        return data
+    
+    def _team_section(self, common_abbr: str) -> Dict:
+        """Static team header fields (no API calls)"""
+        info = TEAM_INFO_BY_ANY_ABBR.get(common_abbr, _UNKNOWN_TEAM)
+        return {
+            'abbreviation': common_abbr,  # Use common abbreviation for display
+            'name': info.name,
+            'city_state': f"{info.city}, {info.state}",
+            'conference': info.conf,
+            'division': info.div,
+            'logo_path': f"assets/teams/{common_abbr}.png"  # Use common abbreviation for logo
+        }
+    
+    def _game_info_section(self, away_api: str, home_api: str, date: str) -> Dict:
+        """Game info section of the header"""
+        return self._format_game_info_section(home_api, self.get_game_info(away_api, home_api, date))
+    
+    def _format_game_info_section(self, home_api: str, game_info: Dict) -> Dict:
+        """Shape get_game_info() output into the header's game_info section"""
+        home_info = TEAM_INFO_BY_ANY_ABBR.get(home_api, _UNKNOWN_TEAM)
         return {
             'game_info': {
-                'city_state': f"{home_info.get('city', '')}, {home_info.get('state', '')}",
+                'city_state': f"{home_info.city}, {home_info.state}",
                 'date': game_info['date'],
                 'time': game_info['time'],
                 'stadium': game_info['venue']
-            },
-            'away_team': {
-                'abbreviation': away_common,  # Use common abbreviation for display
-                'name': away_info.get('name', ''),
-                'city_state': f"{away_info.get('city', '')}, {away_info.get('state', '')}",
-                'conference': away_info.get('conf', ''),
-                'division': away_info.get('div', ''),
-                'logo_path': f"assets/teams/{away_common}.png",  # Use common abbreviation for logo
-                'records': away_records
-            },
-            'home_team': {
-                'abbreviation': home_common,  # Use common abbreviation for display
-                'name': home_info.get('name', ''),
-                'city_state': f"{home_info.get('city', '')}, {home_info.get('state', '')}",
-                'conference': home_info.get('conf', ''),
-                'division': home_info.get('div', ''),
-                'logo_path': f"assets/teams/{home_common}.png",  # Use common abbreviation for logo
-                'records': home_records
-            },
-            'h2h_season_record': h2h_record
+            }
+        }
+    
+    def collect_stream(self, away_team: str, home_team: str, date: str,
+                       pool: Executor) -> Iterator[Future]:
+        """
+        Submit each header section to pool and yield its future
+        
+        Every future resolves to a partial dict in the same shape collect() returns;
+        merging them one level deep (see MatchupReportGenerator) gives the full data.
+        The static team fields are yielded first as an already-completed future.
+        """
+        to_api, to_common = COMMON_TO_API.get, API_TO_COMMON.get
+        away_api = to_api(away_team, away_team)
+        home_api = to_api(home_team, home_team)
+        away_common = to_common(away_api, away_api)
+        home_common = to_common(home_api, home_api)
+        
+        print(f"Collecting game header for {away_common} @ {home_common} on {date}")
+        
+        season = _get_season(date)
+        
+        static = Future()
+        static.set_result({
+            'away_team': self._team_section(away_common),
+            'home_team': self._team_section(home_common)
+        })
+        yield static
+        
+        yield pool.submit(self._game_info_section, away_api, home_api, date)
+        # Both sides share one standings request, as in collect(); head-to-head
+        # comes from the away team's games instead of another request
+        overall = pool.submit(self._get_overall_records, [away_api, home_api], season)
+        away_games = pool.submit(self._fetch_team_games, away_api, season, date)
+        home_games = pool.submit(self._fetch_team_games, home_api, season, date)
+        
+        yield _when_done(lambda records, games: {
+            'away_team': {'records': self._build_team_records(away_api, records[away_api], games)},
+            'h2h_season_record': self._h2h_record(games, away_api, home_api)
+        }, overall, away_games)
+        yield _when_done(lambda records, games: {
+            'home_team': {'records': self._build_team_records(home_api, records[home_api], games)}
+        }, overall, home_games)
+
+    
+    async def _fetch_team_games_async(self, client: httpx.AsyncClient, team: str,
+                                      season: str, date: str) -> List[Game]:
+        """Async _fetch_team_games(), sharing the same per-instance cache"""
+        if self.season_wide:
+            # The league-wide fetch is shared across threads, so run it off the event loop
+            return await asyncio.to_thread(self._fetch_team_games, team, season, date)
+        
+        key = (team, season, date)
+        if key in self._team_games_cache:
+            return self._team_games_cache[key]
+        
+        games = await self._fetch_games_async(client, *self._team_games_request(team, season, date))
+        
+        # Don't cache failed fetches so a later call can retry
+        if games is None:
+            return []
+        self._team_games_cache[key] = games
+        return games
+    
+    async def _get_overall_records_async(self, client: httpx.AsyncClient, teams: List[str],
+                                         season: str) -> Dict[str, str]:
+        """Async _get_overall_records(), sharing the same per-instance memo"""
+        missing = [team for team in teams if (team, season) not in self._record_cache]
+        if missing:
+            data = await self._make_request_async(client, *self._standings_request(missing, season))
+            self._store_overall_records(missing, season, data)
+        return self._cached_records(teams, season)
+    
+    def _async_client(self) -> httpx.AsyncClient:
+        """HTTP/2 client for the async request paths"""
+        return httpx.AsyncClient(http2=True, auth=(self.api_key or '', self.password),
+                                 headers=REQUEST_HEADERS,
+                                 timeout=30.0, limits=httpx.Limits(max_connections=10))
+    
+    async def collect_async(self, away_team: str, home_team: str, date: str,
+                            client: httpx.AsyncClient = None) -> Dict:
+        """
+        Async version of collect()
+        
+        Issues every request at once over a single HTTP/2 connection, paced only by
+        the token bucket instead of a fixed sleep before each call. Returns the same
+        data as collect(). Pass client to share a connection across games.
+        """
+        if client is None:
+            async with self._async_client() as client:
+                return await self.collect_async(away_team, home_team, date, client)
+        
+        to_api, to_common = COMMON_TO_API.get, API_TO_COMMON.get
+        away_api = to_api(away_team, away_team)
+        home_api = to_api(home_team, home_team)
+        away_common = to_common(away_api, away_api)
+        home_common = to_common(home_api, home_api)
+        
+        print(f"Collecting game header for {away_common} @ {home_common} on {date}")
+        
+        season = _get_season(date)
+        
+        (game_data, overall,
+         away_games, home_games) = await asyncio.gather(
+            self._make_request_async(client, *self._game_info_request(away_api, home_api, date)),
+            self._get_overall_records_async(client, [away_api, home_api], season),
+            self._fetch_team_games_async(client, away_api, season, date),
+            self._fetch_team_games_async(client, home_api, season, date)
+        )
+        
+        game_info = self._parse_game_info(game_data, away_api, home_api, date)
+        away_records = self._build_team_records(away_api, overall[away_api], away_games)
+        home_records = self._build_team_records(home_api, overall[home_api], home_games)
+        
+        return {
+            **self._format_game_info_section(home_api, game_info),
+            'away_team': {**self._team_section(away_common), 'records': away_records},
+            'home_team': {**self._team_section(home_common), 'records': home_records},
+            'h2h_season_record': self._h2h_record(away_games, away_api, home_api)
         }
+    
+    async def collect_many_async(self, matchups: Iterable[Tuple[str, str, str]],
+                                 max_games: int = 4) -> List[Dict]:
+        """
+        collect_async() for every (away_team, home_team, date) over one shared client
+        
+        At most max_games games are in flight at once; results keep the input order.
+        """
+        semaphore = asyncio.Semaphore(max_games)
+        
+        async with self._async_client() as client:
+            async def collect_one(away_team: str, home_team: str, date: str) -> Dict:
+                async with semaphore:
+                    return await self.collect_async(away_team, home_team, date, client)
+            
+            return await asyncio.gather(*(collect_one(*matchup) for matchup in matchups))
 
 
 # Test the collector
 if __name__ == "__main__":
-    collector = GameHeaderCollector()
-    
     # Test with MIL @ PHI on Jan 19, 2025
-    data = collector.collect('MIL', 'PHI', '20250119')
+    with GameHeaderCollector() as collector:
+        data = collector.collect('MIL', 'PHI', '20250119')
     
     import json
     print("\nEnhanced Game Header Data:")
@@ -6,56 +6,145 @@ Calculates team statistics for last 3, 7, and 12 games
 
 import os
 import requests
-from typing import Dict, List, Optional
+import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional, Tuple
 from requests.auth import HTTPBasicAuth
 from dotenv import load_dotenv
+from src.data.collectors._http_cache import ResponseCache
+from src.data.collectors._seasons import season_for_date
+from src.data.collectors._rolling_kernels import reduce_windows
+import heapq
+import math
 import time
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+
+# Fast JSON decoding when orjson is installed; accepts the raw response bytes either way
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 load_dotenv()
 
+# Rolling windows reported for each team (last N games)
+ROLLING_WINDOWS = (3, 7, 12)
+GAME_LOG_LIMIT = max(ROLLING_WINDOWS)
+
+# (total, stats section, field) for each per-game total, in _logs_to_array column order
+_STAT_PATHS: Tuple[Tuple[str, str, str], ...] = (
+    ('pts', 'offense', 'pts'),
+    ('pts_against', 'defense', 'ptsAgainst'),
+    ('fg_made', 'fieldGoals', 'fgMade'),
+    ('fg_att', 'fieldGoals', 'fgAtt'),
+    ('fg3_made', 'fieldGoals', 'fg3PtMade'),
+    ('fg3_att', 'fieldGoals', 'fg3PtAtt'),
+    ('fg2_made', 'fieldGoals', 'fg2PtMade'),
+    ('fg2_att', 'fieldGoals', 'fg2PtAtt'),
+    ('ft_made', 'freeThrows', 'ftMade'),
+    ('ft_att', 'freeThrows', 'ftAtt'),
+    ('off_reb', 'rebounds', 'offReb'),
+    ('def_reb', 'rebounds', 'defReb'),
+    ('reb', 'rebounds', 'reb'),
+    ('ast', 'offense', 'ast'),
+    ('stl', 'defense', 'stl'),
+    ('blk', 'defense', 'blk'),
+    ('tov', 'defense', 'tov'),
+)
+
+# Per-game average fed by each _STAT_PATHS column
+AVERAGE_KEYS = ('ps', 'pa', 'fg', 'fga', 'three_p', 'three_pa', 'two_p', 'two_pa',
+                'ft', 'fta', 'orb', 'drb', 'trb', 'ast', 'stl', 'blk', 'tov')
+
+# Shooting percentages as (key, made column, attempted column)
+PCT_COLUMNS = (('fg_pct', 2, 3), ('three_pct', 4, 5), ('two_pct', 6, 7), ('ft_pct', 8, 9))
+_MADE = np.array([made for _, made, _ in PCT_COLUMNS], dtype=np.int64)
+_ATT = np.array([att for _, _, att in PCT_COLUMNS], dtype=np.int64)
+
+# Field goal columns used to derive 2-pointers when the API doesn't split them out
+_FG_MADE, _FG_ATT, _FG3_MADE, _FG3_ATT, _FG2_MADE, _FG2_ATT = range(2, 8)
+
+# Shared stand-in for a missing stats section
+_EMPTY = {}
+
 class RollingStatsCollector:
     """Collects rolling statistics for teams (last 3, 7, 12 games)"""
     
-    def __init__(self):
+    # Spacing is measured from the previous request by any instance, since MSF limits the account
+    _request_lock = threading.Lock()
+    _last_request = 0.0
+    
+    def __init__(self, use_cache: bool = True):
         self.api_key = os.getenv('MSF_API_KEY')
         self.password = os.getenv('MSF_PASSWORD', 'MYSPORTSFEEDS')
         self.base_url = 'https://api.mysportsfeeds.com/v2.1/pull/nba'
         self.auth = HTTPBasicAuth(self.api_key, self.password)
         
+        # Keep-alive session so every game-log request reuses one pooled TLS connection
+        # (429s are left to _make_request, which backs off and keeps the request spacing)
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4, pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504])))
+        
         # Rate limiting - INCREASED DELAYS
         self.request_delay = 5.0  # Increased from 2 to 5 seconds between requests
         self.retry_delay = 30  # Increased from 20 to 30 seconds on rate limit
         self.max_retries = 3  # Maximum number of retries for rate-limited requests
         
+        # Game logs repeat across a report slate; cached responses skip the delay entirely
+        self.cache = ResponseCache() if use_cache else None
+        
         # Abbreviation mappings
         self.common_to_api = {
             'BKN': 'BRO',
             'OKC': 'OKL',
         }
     
+    def close(self):
+        """Release pooled connections and the disk cache handle"""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
     def _convert_to_api_abbr(self, common_abbr: str) -> str:
         """Convert common abbreviation to API abbreviation"""
         return self.common_to_api.get(common_abbr, common_abbr)
     
-    def _get_season(self, date: str) -> str:
-        """Determine season from date"""
-        year = int(date[:4])
-        month = int(date[4:6])
-        if month >= 10:
-            return f"{year}-{year+1}-regular"
-        else:
-            return f"{year-1}-{year}-regular"
+    _get_season = staticmethod(season_for_date)
+    
+    def _wait_for_slot(self):
+        """Block until request_delay has passed since the last request from any thread or instance"""
+        with self._request_lock:
+            wait = self._last_request + self.request_delay - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            type(self)._last_request = time.monotonic()
     
     def _make_request(self, endpoint: str, params: Dict = None, retry_count: int = 0) -> Optional[Dict]:
         """Make API request with improved rate limiting and retry logic"""
         url = f"{self.base_url}/{endpoint}"
         
-        # Always wait before making a request
-        time.sleep(self.request_delay)
+        if self.cache is not None:
+            cached = self.cache.get(endpoint, params)
+            if cached is not None:
+                return cached
+        
+        # Wait out the spacing left over from the previous request
+        self._wait_for_slot()
         
         try:
-            response = requests.get(url, auth=self.auth, params=params)
+            response = self.session.get(url, params=params)
             
             if response.status_code == 429:
                 if retry_count < self.max_retries:
@@ -65,21 +154,38 @@ class RollingStatsCollector:
                     return self._make_request(endpoint, params, retry_count + 1)
                 else:
                     print(f"  ❌ Max retries reached. Skipping this request.")
-                    return None
+                    return self._stale_response(endpoint, params)
             
             response.raise_for_status()
-            return response.json()
+            data = _json_loads(response.content)
+            if self.cache is not None:
+                self.cache.set(endpoint, params, data)
+            return data
             
         except Exception as e:
             print(f"  ❌ Error: {e}")
+            return self._stale_response(endpoint, params)
+    
+    def _stale_response(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
+        """Expired cached response to fall back on when MSF refuses a request"""
+        if self.cache is None:
             return None
+        data = self.cache.get(endpoint, params, allow_stale=True)
+        if data is not None:
+            print(f"  ⚠️  Using cached {endpoint} response")
+        return data
     
     def get_team_game_logs(self, team: str, season: str, before_date: str) -> List[Dict]:
         """Get team game logs before a specific date"""
         endpoint = f"{season}/team_gamelogs.json"
+        day_before = (datetime.strptime(before_date, '%Y%m%d') - timedelta(days=1)).strftime('%Y%m%d')
         params = {
             'team': team,
-            'limit': 12  # Get last 12 games max
+            'date': f'until-{day_before}',  # Local dates, so this keeps every game the UTC filter below keeps
+            'sort': 'game.starttime.D',  # Newest first, so the limit keeps the most recent games
+            # One spare log: an evening game on the local day before can carry a UTC date of
+            # before_date and be dropped below (teams play at most once a day)
+            'limit': GAME_LOG_LIMIT + 1
         }
         
         data = self._make_request(endpoint, params)
@@ -88,127 +194,66 @@ class RollingStatsCollector:
             print(f"  ⚠️  No game logs found for {team}")
             return []
         
-        # Filter games before the target date and sort by date (most recent first)
-        game_logs = []
-        for log in data['gamelogs']:
-            game = log.get('game', {})
-            game_date = game.get('startTime', '')[:10].replace('-', '')  # Convert to YYYYMMDD
-            
-            if game_date < before_date:
-                game_logs.append(log)
-        
-        # Sort by date descending (most recent first)
-        game_logs.sort(key=lambda x: x['game']['startTime'], reverse=True)
+        # Most recent games before the target date (startTime[:10] converted to YYYYMMDD)
+        game_logs = heapq.nlargest(
+            GAME_LOG_LIMIT,
+            (log for log in data['gamelogs']
+             if log.get('game', {}).get('startTime', '')[:10].replace('-', '') < before_date),
+            key=lambda x: x['game']['startTime'])
         
-        print(f"  ✓ Found {len(game_logs[:12])} games for {team}")
-        return game_logs[:12]  # Return only the last 12 games
+        print(f"  ✓ Found {len(game_logs)} games for {team}")
+        return game_logs
     
-    def calculate_averages(self, game_logs: List[Dict], num_games: int) -> Dict:
-        """Calculate averages for the specified number of games"""
-        
-        if not game_logs or len(game_logs) == 0:
-            return self._empty_stats()
-        
-        # Take only the number of games we need
-        games_to_avg = game_logs[:min(num_games, len(game_logs))]
-        actual_games = len(games_to_avg)
+    def _logs_to_array(self, game_logs: List[Dict]) -> np.ndarray:
+        """Per-game totals as a (games, len(_STAT_PATHS)) matrix"""
+        stat_paths = _STAT_PATHS
+        rows = []
+        for log in game_logs:
+            stats = log.get('stats', _EMPTY)
+            row = [stats.get(section, _EMPTY).get(field, 0) for _, section, field in stat_paths]
+            
+            # 2-pointers - use the API's split if present, otherwise total FG minus 3-pointers
+            fg = stats.get('fieldGoals', _EMPTY)
+            if 'fg2PtMade' not in fg or 'fg2PtAtt' not in fg:
+                row[_FG2_MADE] = row[_FG_MADE] - row[_FG3_MADE]
+                row[_FG2_ATT] = row[_FG_ATT] - row[_FG3_ATT]
+            rows.append(row)
         
+        return np.array(rows, dtype=np.float64).reshape(-1, len(stat_paths))
+    
+    def _window_stats(self, means: np.ndarray, pcts: np.ndarray, actual_games: int) -> Dict:
+        """Stats dict for one row of reduce_windows output"""
         if actual_games == 0:
             return self._empty_stats()
         
-        # Initialize totals
-        totals = {
-            'pts': 0, 'pts_against': 0,
-            'fg_made': 0, 'fg_att': 0,
-            'fg3_made': 0, 'fg3_att': 0,
-            'fg2_made': 0, 'fg2_att': 0,
-            'ft_made': 0, 'ft_att': 0,
-            'off_reb': 0, 'def_reb': 0, 'reb': 0,
-            'ast': 0, 'stl': 0, 'blk': 0, 'tov': 0
-        }
-        
-        # Sum up all stats
-        for log in games_to_avg:
-            stats = log.get('stats', {})  # This line MUST be here first
-
-            # Points scored
-            offense = stats.get('offense', {})
-            totals['pts'] += offense.get('pts', 0)
-            
-            # Points allowed - get from defense stats
-            defense = stats.get('defense', {})
-            totals['pts_against'] += defense.get('ptsAgainst', 0)
-            
-            # Field goals (total)
-            fg = stats.get('fieldGoals', {})
-            totals['fg_made'] += fg.get('fgMade', 0)
-            totals['fg_att'] += fg.get('fgAtt', 0)
-            
-            # 3-pointers
-            totals['fg3_made'] += fg.get('fg3PtMade', 0)
-            totals['fg3_att'] += fg.get('fg3PtAtt', 0)
-            
-            # 2-pointers - Check if API provides these directly, otherwise calculate
-            if 'fg2PtMade' in fg and 'fg2PtAtt' in fg:
-                totals['fg2_made'] += fg.get('fg2PtMade', 0)
-                totals['fg2_att'] += fg.get('fg2PtAtt', 0)
-            else:
-                # Calculate 2-pointers as total FG minus 3-pointers
-                fg_made = fg.get('fgMade', 0)
-                fg_att = fg.get('fgAtt', 0)
-                fg3_made = fg.get('fg3PtMade', 0)
-                fg3_att = fg.get('fg3PtAtt', 0)
-                totals['fg2_made'] += (fg_made - fg3_made)
-                totals['fg2_att'] += (fg_att - fg3_att)
-            
-            # Free throws
-            ft = stats.get('freeThrows', {})
-            totals['ft_made'] += ft.get('ftMade', 0)
-            totals['ft_att'] += ft.get('ftAtt', 0)
-            
-            # Rebounds
-            reb = stats.get('rebounds', {})
-            totals['off_reb'] += reb.get('offReb', 0)
-            totals['def_reb'] += reb.get('defReb', 0)
-            totals['reb'] += reb.get('reb', 0)
-            
-            # Assists
-            totals['ast'] += offense.get('ast', 0)
-            
-            # Defensive stats
-            defense = stats.get('defense', {})
-            totals['stl'] += defense.get('stl', 0)
-            totals['blk'] += defense.get('blk', 0)
-            totals['tov'] += defense.get('tov', 0)
-        
-        # Calculate averages for all 21 stats
-        stats = {
-            'ps': round(totals['pts'] / actual_games, 1),
-            'pa': round(totals['pts_against'] / actual_games, 1),
-            'fg': round(totals['fg_made'] / actual_games, 1),
-            'fga': round(totals['fg_att'] / actual_games, 1),
-            'fg_pct': round((totals['fg_made'] / totals['fg_att'] * 100) if totals['fg_att'] > 0 else 0, 1),
-            'three_p': round(totals['fg3_made'] / actual_games, 1),
-            'three_pa': round(totals['fg3_att'] / actual_games, 1),
-            'three_pct': round((totals['fg3_made'] / totals['fg3_att'] * 100) if totals['fg3_att'] > 0 else 0, 1),
-            'two_p': round(totals['fg2_made'] / actual_games, 1),
-            'two_pa': round(totals['fg2_att'] / actual_games, 1),
-            'two_pct': round((totals['fg2_made'] / totals['fg2_att'] * 100) if totals['fg2_att'] > 0 else 0, 1),
-            'ft': round(totals['ft_made'] / actual_games, 1),
-            'fta': round(totals['ft_att'] / actual_games, 1),
-            'ft_pct': round((totals['ft_made'] / totals['ft_att'] * 100) if totals['ft_att'] > 0 else 0, 1),
-            'orb': round(totals['off_reb'] / actual_games, 1),
-            'drb': round(totals['def_reb'] / actual_games, 1),
-            'trb': round(totals['reb'] / actual_games, 1),
-            'ast': round(totals['ast'] / actual_games, 1),
-            'stl': round(totals['stl'] / actual_games, 1),
-            'blk': round(totals['blk'] / actual_games, 1),
-            'tov': round(totals['tov'] / actual_games, 1),
-            'games_included': actual_games
-        }
+        # Python's round() keeps the exact rounding of the scalar implementation
+        stats = self._empty_stats()
+        stats.update(zip(AVERAGE_KEYS, (round(value, 1) for value in means.tolist())))
+        for (key, _, _), pct in zip(PCT_COLUMNS, pcts.tolist()):
+            stats[key] = 0 if math.isnan(pct) else round(pct, 1)
+        stats['games_included'] = actual_games
         
         return stats
     
+    def _reduce(self, game_logs: List[Dict], windows) -> List[Dict]:
+        """Stats dicts for each window size (ascending) over the most recent games"""
+        game_matrix = self._logs_to_array(game_logs)
+        windows = np.asarray(windows, dtype=np.int64)
+        means, pcts = reduce_windows(game_matrix, windows, _MADE, _ATT)
+        return [self._window_stats(means[w], pcts[w], min(int(n), game_matrix.shape[0]))
+                for w, n in enumerate(windows)]
+    
+    def calculate_windows(self, game_logs: List[Dict]) -> Dict[str, Dict]:
+        """Calculate averages for every ROLLING_WINDOWS window from one pass over the logs"""
+        windows = self._reduce(game_logs, ROLLING_WINDOWS)
+        return {f'last_{n}': stats for n, stats in zip(ROLLING_WINDOWS, windows)}
+    
+    def calculate_averages(self, game_logs: List[Dict], num_games: int) -> Dict:
+        """Calculate averages for the specified number of games"""
+        if not game_logs:
+            return self._empty_stats()
+        return self._reduce(game_logs, (num_games,))[0]
+    
     def _empty_stats(self) -> Dict:
         """Return empty stats structure"""
         return {
@@ -245,17 +290,12 @@ class RollingStatsCollector:
         print(f"  (Calculating last 3, 7, and 12 game averages)")
         print(f"  ⏳ Note: Using 5-second delays between API calls to avoid rate limits")
         
-        # Get game logs for away team first
-        print(f"\n  • Fetching {away_team} game logs...")
-        away_logs = self.get_team_game_logs(away_api, season, date)
-        
-        # Add extra delay between teams to be safe
-        print(f"  ⏳ Waiting before fetching {home_team} data...")
-        time.sleep(self.request_delay)
-        
-        # Get game logs for home team
-        print(f"  • Fetching {home_team} game logs...")
-        home_logs = self.get_team_game_logs(home_api, season, date)
+        # Fetch both teams' game logs concurrently; _make_request keeps them spaced apart
+        print(f"\n  • Fetching {away_team} and {home_team} game logs...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            away_future = executor.submit(self.get_team_game_logs, away_api, season, date)
+            home_future = executor.submit(self.get_team_game_logs, home_api, season, date)
+            away_logs, home_logs = away_future.result(), home_future.result()
         
         # Calculate averages for different periods
         print("\n  • Calculating rolling averages...")
@@ -276,11 +316,7 @@ class RollingStatsCollector:
         # Calculate away team stats if we have data
         if away_logs:
             print(f"    - {away_team} averages...")
-            away_stats = {
-                'last_3': self.calculate_averages(away_logs, 3),
-                'last_7': self.calculate_averages(away_logs, 7),
-                'last_12': self.calculate_averages(away_logs, 12)
-            }
+            away_stats = self.calculate_windows(away_logs)
             print(f"      ✓ Last 3: {away_stats['last_3']['games_included']} games")
             print(f"      ✓ Last 7: {away_stats['last_7']['games_included']} games")
             print(f"      ✓ Last 12: {away_stats['last_12']['games_included']} games")
@@ -290,11 +326,7 @@ class RollingStatsCollector:
         # Calculate home team stats if we have data
         if home_logs:
             print(f"    - {home_team} averages...")
-            home_stats = {
-                'last_3': self.calculate_averages(home_logs, 3),
-                'last_7': self.calculate_averages(home_logs, 7),
-                'last_12': self.calculate_averages(home_logs, 12)
-            }
+            home_stats = self.calculate_windows(home_logs)
             print(f"      ✓ Last 3: {home_stats['last_3']['games_included']} games")
             print(f"      ✓ Last 7: {home_stats['last_7']['games_included']} games")
             print(f"      ✓ Last 12: {home_stats['last_12']['games_included']} games")
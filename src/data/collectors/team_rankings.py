@@ -6,195 +6,343 @@ Fetches comprehensive team rankings including overall, offensive, defensive, con
 
 import os
 import time
+import threading
 import requests
+import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Optional, List, Tuple
 from requests.auth import HTTPBasicAuth
 from dotenv import load_dotenv
+from src.data.collectors._http_cache import ResponseCache
+from src.data.collectors._seasons import season_for_date
+
+# Fast JSON decoding when orjson is installed; accepts the raw response bytes either way
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Optional incremental parser for the large team_stats_totals payload
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 load_dotenv()
 
+# Conference and division membership (common and API abbreviations both listed)
+EASTERN_TEAMS = ['ATL', 'BOS', 'BKN', 'BRO', 'CHA', 'CHI', 'CLE', 'DET', 'IND', 'MIA', 'MIL', 'NYK', 'ORL', 'PHI', 'TOR', 'WAS']
+WESTERN_TEAMS = ['DAL', 'DEN', 'GSW', 'HOU', 'LAC', 'LAL', 'MEM', 'MIN', 'NOP', 'OKC', 'OKL', 'PHX', 'POR', 'SAC', 'SAS', 'UTA']
+
+DIVISIONS = {
+    'Atlantic': ['BOS', 'BKN', 'BRO', 'NYK', 'PHI', 'TOR'],
+    'Central': ['CHI', 'CLE', 'DET', 'IND', 'MIL'],
+    'Southeast': ['ATL', 'CHA', 'MIA', 'ORL', 'WAS'],
+    'Northwest': ['DEN', 'MIN', 'OKC', 'OKL', 'POR', 'UTA'],
+    'Pacific': ['GSW', 'LAC', 'LAL', 'PHX', 'SAC'],
+    'Southwest': ['DAL', 'HOU', 'MEM', 'NOP', 'SAS']
+}
+
+# The only team_stats_totals fields the rankings read, by stats section
+RANKING_FIELDS = {
+    'offense': ('ptsPerGame',),
+    'defense': ('oppPtsPerGame', 'ptsAgainstPerGame'),
+    'standings': ('wins', 'losses', 'winPct'),
+}
+
+
+def _slim_team_stats(team: Dict) -> Dict:
+    """Copy of a teamStatsTotals entry with only the RANKING_FIELDS that are present"""
+    stats = team.get('stats', {})
+    slim = {
+        'team': {'abbreviation': team['team']['abbreviation']},
+        'stats': {section: {field: stats[section][field] for field in fields if field in stats[section]}
+                  for section, fields in RANKING_FIELDS.items() if section in stats}
+    }
+    for key in ('conferenceRank', 'divisionRank'):
+        if key in team:
+            slim[key] = team[key]
+    return slim
+
+
+def _parse_standings_ranks(response: requests.Response) -> Dict:
+    """standings response reduced to each team's official [conference rank, division rank]"""
+    data = _json_loads(response.content)
+    return {'ranks': {team['team']['abbreviation']: [team.get('conferenceRank', {}).get('rank'),
+                                                     team.get('divisionRank', {}).get('rank')]
+                      for team in data.get('teams', [])}}
+
+
+def _parse_team_stats_totals(response: requests.Response) -> Dict:
+    """
+    team_stats_totals response reduced to RANKING_FIELDS
+    
+    With ijson installed the body is streamed entry by entry, so the full stats tree for
+    every team is never built; floats are kept as floats (not Decimal) for the report JSON.
+    """
+    if ijson is not None:
+        response.raw.decode_content = True
+        teams = ijson.items(response.raw, 'teamStatsTotals.item', use_float=True)
+    else:
+        teams = _json_loads(response.content).get('teamStatsTotals', [])
+    return {'teamStatsTotals': [_slim_team_stats(team) for team in teams]}
+
+
+def _ordinal_ranks(values: np.ndarray) -> List[int]:
+    """1-based ascending rank of each value; ties keep input order, like a stable sorted()"""
+    ranks = np.empty(len(values), dtype=np.int64)
+    ranks[np.argsort(values, kind='stable')] = np.arange(1, len(values) + 1)
+    return ranks.tolist()
+
+
+def _group_ranks(values: np.ndarray, groups: np.ndarray) -> List[Optional[int]]:
+    """Ascending rank of each value within its group ('' = no group, ranked None)"""
+    ranks = [None] * len(values)
+    for group in np.unique(groups):
+        if not group:
+            continue
+        members = np.flatnonzero(groups == group)
+        for member, rank in zip(members.tolist(), _ordinal_ranks(values[members])):
+            ranks[member] = rank
+    return ranks
+
 class TeamRankingsCollector:
     """Collects team ranking data from MySportsFeeds API"""
     
-    def __init__(self):
+    # Spacing is measured from the previous request by any instance, since MSF limits the account
+    _request_lock = threading.Lock()
+    _last_request = 0.0
+    
+    def __init__(self, use_cache: bool = True):
         self.api_key = os.getenv('MSF_API_KEY')
         self.password = os.getenv('MSF_PASSWORD', 'MYSPORTSFEEDS')
         self.base_url = 'https://api.mysportsfeeds.com/v2.1/pull/nba'
         self.auth = HTTPBasicAuth(self.api_key, self.password)
         
+        # Keep-alive session shared by the standings and team stats requests
+        # (429s are left to _make_request, which backs off and keeps the request spacing)
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4, pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504])))
+        
         # Rate limiting
         self.request_delay = 2.0
         self.retry_delay = 30
         
+        # Standings and team stats are season-wide, so one response serves the whole slate
+        self.cache = ResponseCache() if use_cache else None
+        
+        # Ranked snapshots shared across collect() calls, so teams on one slate whose recent
+        # games fall on the same dates rank each snapshot only once
+        self._snapshot_cache = {}  # (season, date) -> (overall rankings, stats rankings)
+        self._standings_ranks = {}  # (season, date) -> official conference/division ranks
+        
         # Common to API abbreviation mapping
         self.common_to_api = {
             'BKN': 'BRO',  # Brooklyn Nets
             'OKC': 'OKL',  # Oklahoma City Thunder
         }
+        
+        # API to common abbreviation mapping (reverse)
+        self.api_to_common = {api: common for common, api in self.common_to_api.items()}
+    
+    def close(self):
+        """Release pooled connections and the disk cache handle"""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
     
     def _convert_to_api_abbr(self, common_abbr: str) -> str:
         """Convert common abbreviation to API abbreviation"""
         return self.common_to_api.get(common_abbr, common_abbr)
     
-    def _get_season(self, date: str) -> str:
-        """Determine season from date"""
-        year = int(date[:4])
-        month = int(date[4:6])
-        if month >= 10:
-            return f"{year}-{year+1}-regular"
-        else:
-            return f"{year-1}-{year}-regular"
+    def _from_api(self, api_abbr: str) -> str:
+        """Convert API abbreviation to common abbreviation"""
+        return self.api_to_common.get(api_abbr, api_abbr)
     
-    def _get_overall_standings(self, season: str) -> Dict:
-        """Fetch overall standings/rankings"""
+    _get_season = staticmethod(season_for_date)
+    
+    def _wait_for_slot(self):
+        """Block until request_delay has passed since the last request from any thread or instance"""
+        with self._request_lock:
+            wait = self._last_request + self.request_delay - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            type(self)._last_request = time.monotonic()
+    
+    def _make_request(self, endpoint: str, params: Dict = None, timeout: float = None,
+                      parse: Callable[[requests.Response], Dict] = None) -> Dict:
+        """
+        Fetch endpoint JSON through the response cache, falling back to a stale copy on errors
+        
+        parse, if given, builds the cached data from the streamed response instead of
+        decoding the whole body.
+        """
+        if self.cache is not None:
+            cached = self.cache.get(endpoint, params)
+            if cached is not None:
+                return cached
+        
+        url = f"{self.base_url}/{endpoint}"
         try:
-            endpoint = f"{season}/standings.json"
-            url = f"{self.base_url}/{endpoint}"
-            
-            time.sleep(self.request_delay)
-            response = requests.get(url, auth=self.auth)
+            self._wait_for_slot()
+            response = self.session.get(url, params=params, timeout=timeout, stream=True)
             
             if response.status_code == 429:
+                response.close()
                 time.sleep(self.retry_delay)
-                response = requests.get(url, auth=self.auth)
-            
-            response.raise_for_status()
-            data = response.json()
+                self._wait_for_slot()
+                response = self.session.get(url, params=params, timeout=timeout, stream=True)
             
+            with response:
+                response.raise_for_status()
+                data = parse(response) if parse else _json_loads(response.content)
+        except Exception:
+            stale = self.cache.get(endpoint, params, allow_stale=True) if self.cache is not None else None
+            if stale is None:
+                raise
+            print(f"      Using cached {endpoint} response")
+            return stale
+        
+        if self.cache is not None:
+            self.cache.set(endpoint, params, data)
+        return data
+    
+    def _get_combined_season_data(self, season: str, date: str = None) -> Tuple[Dict, Dict]:
+        """Overall and offensive/defensive rankings from a single team_stats_totals request"""
+        if (season, date) in self._snapshot_cache:
+            return self._snapshot_cache[(season, date)]
+        
+        try:
+            params = {'date': date} if date else None
+            data = self._make_request(f"{season}/team_stats_totals.json", params, timeout=10,
+                                      parse=_parse_team_stats_totals)
+        except Exception as e:
+            print(f"Error fetching team stats totals: {e}")
+            return {}, {}
+        
+        if not data or not data.get('teamStatsTotals'):
+            return {}, {}
+        all_teams = data['teamStatsTotals']
+        snapshot = self._rank_standings(all_teams), self._rank_team_stats(all_teams)
+        self._snapshot_cache[(season, date)] = snapshot
+        return snapshot
+    
+    def _get_standings_ranks(self, season: str, date: str = None) -> Dict[str, Dict]:
+        """Official conference/division ranks (with MSF's tiebreaks) from standings.json"""
+        if (season, date) in self._standings_ranks:
+            return self._standings_ranks[(season, date)]
+        
+        # Only the rank objects are read, so skip the standings stats
+        params = {'stats': 'W'}
+        if date:
+            params['date'] = date
+        try:
+            data = self._make_request(f"{season}/standings.json", params, timeout=10,
+                                      parse=_parse_standings_ranks)
+        except Exception as e:
+            print(f"Error fetching standings: {e}")
+            return {}
+        
+        ranks = {}
+        for abbr, (conf, div) in data.get('ranks', {}).items():
+            ranks[self._from_api(abbr)] = {key: rank for key, rank in (('conference_rank', conf),
+                                                                       ('division_rank', div))
+                                           if rank is not None}
+        self._standings_ranks[(season, date)] = ranks
+        return ranks
+    
+    def _rank_standings(self, teams: List[Dict]) -> Dict:
+        """Overall rankings by win percentage, with conference/division places in win% order"""
+        try:
             # Process standings into rankings
             rankings = {}
-            if data and 'teams' in data:
-                # Sort teams by win percentage for overall rank
-                teams_sorted = sorted(data['teams'], 
-                                    key=lambda x: x['stats']['standings']['winPct'], 
-                                    reverse=True)
+            conference_counts = {}
+            division_counts = {}
+            
+            # Sort teams by win percentage for overall rank
+            teams_sorted = sorted(teams, 
+                                key=lambda x: x['stats']['standings']['winPct'], 
+                                reverse=True)
+            
+            for rank, team in enumerate(teams_sorted, 1):
+                abbr = self._from_api(team['team']['abbreviation'])
                 
-                for rank, team in enumerate(teams_sorted, 1):
-                    abbr = team['team']['abbreviation']
-                    # Convert API abbreviation to common
-                    if abbr == 'BRO':
-                        abbr = 'BKN'
-                    elif abbr == 'OKL':
-                        abbr = 'OKC'
-                    
-                    stats = team['stats']['standings']
-                    rankings[abbr] = {
-                        'overall_rank': rank,
-                        'wins': stats['wins'],
-                        'losses': stats['losses'],
-                        'win_pct': stats['winPct'],
-                        'conference_rank': team['conferenceRank']['rank'] if 'conferenceRank' in team else None,
-                        'division_rank': team['divisionRank']['rank'] if 'divisionRank' in team else None
-                    }
+                # team_stats_totals has no conference/division ranks, so count places in win% order;
+                # a team in neither conference (e.g. an unmapped abbreviation) gets no place
+                conference = 'Eastern' if abbr in EASTERN_TEAMS else 'Western' if abbr in WESTERN_TEAMS else ''
+                division = next((name for name, div_teams in DIVISIONS.items() if abbr in div_teams), None)
+                if conference:
+                    conference_counts[conference] = conference_counts.get(conference, 0) + 1
+                if division:
+                    division_counts[division] = division_counts.get(division, 0) + 1
+                
+                stats = team['stats']['standings']
+                rankings[abbr] = {
+                    'overall_rank': rank,
+                    'wins': stats['wins'],
+                    'losses': stats['losses'],
+                    'win_pct': stats['winPct'],
+                    'conference_rank': team['conferenceRank']['rank'] if 'conferenceRank' in team else conference_counts.get(conference),
+                    'division_rank': team['divisionRank']['rank'] if 'divisionRank' in team else division_counts.get(division)
+                }
             
             return rankings
             
         except Exception as e:
-            print(f"Error fetching standings: {e}")
+            print(f"Error ranking standings: {e}")
             return {}
     
-    def _get_team_stats_rankings(self, season: str) -> Dict:
-        """Fetch team statistics for offensive and defensive rankings"""
+    def _rank_team_stats(self, all_teams: List[Dict]) -> Dict:
+        """Offensive and defensive rankings (overall, conference, division) from team stats totals"""
         try:
-            endpoint = f"{season}/team_stats_totals.json"
-            url = f"{self.base_url}/{endpoint}"
-            
-            time.sleep(self.request_delay)
-            response = requests.get(url, auth=self.auth, timeout=10)
-            
-            if response.status_code == 429:
-                time.sleep(self.retry_delay)
-                response = requests.get(url, auth=self.auth, timeout=10)
-            
-            response.raise_for_status()
-            data = response.json()
-            
-            # Define conference and division mappings
-            eastern_teams = ['ATL', 'BOS', 'BKN', 'BRO', 'CHA', 'CHI', 'CLE', 'DET', 'IND', 'MIA', 'MIL', 'NYK', 'ORL', 'PHI', 'TOR', 'WAS']
-            western_teams = ['DAL', 'DEN', 'GSW', 'HOU', 'LAC', 'LAL', 'MEM', 'MIN', 'NOP', 'OKC', 'OKL', 'PHX', 'POR', 'SAC', 'SAS', 'UTA']
-            
-            divisions = {
-                'Atlantic': ['BOS', 'BKN', 'BRO', 'NYK', 'PHI', 'TOR'],
-                'Central': ['CHI', 'CLE', 'DET', 'IND', 'MIL'],
-                'Southeast': ['ATL', 'CHA', 'MIA', 'ORL', 'WAS'],
-                'Northwest': ['DEN', 'MIN', 'OKC', 'OKL', 'POR', 'UTA'],
-                'Pacific': ['GSW', 'LAC', 'LAL', 'PHX', 'SAC'],
-                'Southwest': ['DAL', 'HOU', 'MEM', 'NOP', 'SAS']
-            }
-            
             rankings = {}
-            if data and 'teamStatsTotals' in data:
-                all_teams = data['teamStatsTotals']
+            if all_teams:
+                count = len(all_teams)
+                api_abbrs = [t['team']['abbreviation'] for t in all_teams]
+                pts = np.fromiter((t['stats']['offense']['ptsPerGame'] for t in all_teams), float, count=count)
+                opp_pts = np.fromiter((t['stats']['defense'].get('oppPtsPerGame', t['stats']['defense'].get('ptsAgainstPerGame', 0))
+                                       for t in all_teams), float, count=count)
                 
-                # Overall rankings
-                teams_off = sorted(all_teams, key=lambda x: x['stats']['offense']['ptsPerGame'], reverse=True)
-                teams_def = sorted(all_teams, key=lambda x: x['stats']['defense'].get('oppPtsPerGame', x['stats']['defense'].get('ptsAgainstPerGame', 0)))
+                # Conference and division of every team (both abbreviation forms are listed)
+                conferences = np.array(['Eastern' if a in EASTERN_TEAMS else 'Western' if a in WESTERN_TEAMS else ''
+                                        for a in api_abbrs])
+                divisions = np.array([next((name for name, div_teams in DIVISIONS.items() if a in div_teams), '')
+                                      for a in api_abbrs])
                 
-                # Conference rankings
-                eastern_off = sorted([t for t in all_teams if t['team']['abbreviation'] in eastern_teams or (t['team']['abbreviation'] == 'BRO' and 'BKN' in eastern_teams)], 
-                                key=lambda x: x['stats']['offense']['ptsPerGame'], reverse=True)
-                eastern_def = sorted([t for t in all_teams if t['team']['abbreviation'] in eastern_teams or (t['team']['abbreviation'] == 'BRO' and 'BKN' in eastern_teams)], 
-                                key=lambda x: x['stats']['defense'].get('oppPtsPerGame', 0))
-                
-                western_off = sorted([t for t in all_teams if t['team']['abbreviation'] in western_teams or (t['team']['abbreviation'] == 'OKL' and 'OKC' in western_teams)], 
-                                key=lambda x: x['stats']['offense']['ptsPerGame'], reverse=True)
-                western_def = sorted([t for t in all_teams if t['team']['abbreviation'] in western_teams or (t['team']['abbreviation'] == 'OKL' and 'OKC' in western_teams)], 
-                                key=lambda x: x['stats']['defense'].get('oppPtsPerGame', 0))
+                # Most points scored ranks first on offense, fewest allowed first on defense
+                off_ranks = _ordinal_ranks(-pts)
+                def_ranks = _ordinal_ranks(opp_pts)
+                conf_off_ranks = _group_ranks(-pts, conferences)
+                conf_def_ranks = _group_ranks(opp_pts, conferences)
+                div_off_ranks = _group_ranks(-pts, divisions)
+                div_def_ranks = _group_ranks(opp_pts, divisions)
                 
                 # Process all rankings
-                for team in all_teams:
-                    abbr = team['team']['abbreviation']
-                    if abbr == 'BRO':
-                        abbr = 'BKN'
-                    elif abbr == 'OKL':
-                        abbr = 'OKC'
-                    
-                    # Find overall ranks
-                    overall_off_rank = next((i for i, t in enumerate(teams_off, 1) if t['team']['abbreviation'] == team['team']['abbreviation']), None)
-                    overall_def_rank = next((i for i, t in enumerate(teams_def, 1) if t['team']['abbreviation'] == team['team']['abbreviation']), None)
-                    
-                    # Find conference ranks
-                    if abbr in eastern_teams:
-                        conf_off_rank = next((i for i, t in enumerate(eastern_off, 1) if t['team']['abbreviation'] == team['team']['abbreviation']), None)
-                        conf_def_rank = next((i for i, t in enumerate(eastern_def, 1) if t['team']['abbreviation'] == team['team']['abbreviation']), None)
-                    else:
-                        conf_off_rank = next((i for i, t in enumerate(western_off, 1) if t['team']['abbreviation'] == team['team']['abbreviation']), None)
-                        conf_def_rank = next((i for i, t in enumerate(western_def, 1) if t['team']['abbreviation'] == team['team']['abbreviation']), None)
-                    
-                    # Find division
-                    team_division = None
-                    for div_name, teams in divisions.items():
-                        if abbr in teams:
-                            team_division = div_name
-                            break
-                    
-                    # Calculate division ranks
-                    div_off_rank = None
-                    div_def_rank = None
-                    if team_division:
-                        div_teams = divisions[team_division]
-                        division_off = sorted([t for t in all_teams if t['team']['abbreviation'] in div_teams or (t['team']['abbreviation'] == 'BRO' and 'BKN' in div_teams) or (t['team']['abbreviation'] == 'OKL' and 'OKC' in div_teams)], 
-                                            key=lambda x: x['stats']['offense']['ptsPerGame'], reverse=True)
-                        division_def = sorted([t for t in all_teams if t['team']['abbreviation'] in div_teams or (t['team']['abbreviation'] == 'BRO' and 'BKN' in div_teams) or (t['team']['abbreviation'] == 'OKL' and 'OKC' in div_teams)], 
-                                            key=lambda x: x['stats']['defense'].get('oppPtsPerGame', 0))
-                        
-                        div_off_rank = next((i for i, t in enumerate(division_off, 1) if t['team']['abbreviation'] == team['team']['abbreviation']), None)
-                        div_def_rank = next((i for i, t in enumerate(division_def, 1) if t['team']['abbreviation'] == team['team']['abbreviation']), None)
-                    
-                    rankings[abbr] = {
-                        'offensive_rank': overall_off_rank,
-                        'defensive_rank': overall_def_rank,
-                        'conference_offensive': conf_off_rank,
-                        'conference_defensive': conf_def_rank,
-                        'division_offensive': div_off_rank,
-                        'division_defensive': div_def_rank
+                for i, api_abbr in enumerate(api_abbrs):
+                    rankings[self._from_api(api_abbr)] = {
+                        'offensive_rank': off_ranks[i],
+                        'defensive_rank': def_ranks[i],
+                        'conference_offensive': conf_off_ranks[i],
+                        'conference_defensive': conf_def_ranks[i],
+                        'division_offensive': div_off_ranks[i],
+                        'division_defensive': div_def_ranks[i]
                     }
             
             return rankings
             
         except Exception as e:
-            print(f"Error fetching team stats rankings: {e}")
+            print(f"Error ranking team stats: {e}")
             return {}
 
     def _get_conference_division_rankings(self, team_abbr: str, season: str) -> Dict:
@@ -207,35 +355,32 @@ class TeamRankingsCollector:
             print(f"Error fetching conference/division rankings: {e}")
             return {}
     
-    def _get_historical_rankings(self, team_abbr: str, date: str, num_games: int = 12) -> List[Dict]:
-        """Get historical ranking data by fetching standings after each game"""
+    def _get_historical_rankings(self, team_abbr: str, date: str, num_games: int = 12,
+                                 enabled: bool = True) -> List[Dict]:
+        """Get historical ranking data by fetching standings after each game (empty if disabled)"""
+        if not enabled:
+            return []
+        
         historical = []
         
         try:
-            from datetime import datetime, timedelta
-            
             # Get team's game logs to find game dates
             api_abbr = self._convert_to_api_abbr(team_abbr)
             season = self._get_season(date)
             endpoint = f"{season}/team_gamelogs.json"
+            day_before = (datetime.strptime(date, '%Y%m%d') - timedelta(days=1)).strftime('%Y%m%d')
             params = {
                 'team': api_abbr,
+                'date': f'until-{day_before}',  # Only games before the report date
+                'sort': 'game.starttime.D',  # Newest first, so the limit keeps the most recent games
                 'limit': num_games
             }
-            url = f"{self.base_url}/{endpoint}"
             
             print(f"      Getting game dates for {team_abbr}...")
-            time.sleep(self.request_delay)
-            response = requests.get(url, auth=self.auth, params=params)
-            
-            if response.status_code == 429:
-                time.sleep(self.retry_delay)
-                response = requests.get(url, auth=self.auth, params=params)
-            
-            response.raise_for_status()
-            game_data = response.json()
+            game_data = self._make_request(endpoint, params)
             
             if game_data and 'gamelogs' in game_data:
+                # Logs come back newest first, so reverse them into game order
                 games_chronological = list(reversed(game_data['gamelogs']))
                 
                 # print(f"      Fetching historical rankings for {len(games_chronological)} games...")
@@ -246,67 +391,11 @@ class TeamRankingsCollector:
                     
                     if i == len(games_chronological) - 1:
                         # Last game - use current standings
-                        overall_standings = self._get_overall_standings(season)
-                        stats_rankings = self._get_team_stats_rankings(season)
+                        overall_standings, stats_rankings = self._get_combined_season_data(season)
                     else:
-                        # Fetch historical standings
+                        # Standings and team stats as of that date (past snapshots never change, so they stay cached)
                         formatted_date = game_date_str.replace('-', '')
-                        
-                        # Get standings as of that date
-                        time.sleep(self.request_delay)
-                        standings_url = f"{self.base_url}/{season}/standings.json?date={formatted_date}"
-                        stats_url = f"{self.base_url}/{season}/team_stats_totals.json?date={formatted_date}"
-                        
-                        # Get overall standings for that date
-                        standings_response = requests.get(standings_url, auth=self.auth)
-                        if standings_response.status_code == 429:
-                            time.sleep(self.retry_delay)
-                            standings_response = requests.get(standings_url, auth=self.auth)
-                        
-                        overall_standings = {}
-                        if standings_response.status_code == 200:
-                            standings_data = standings_response.json()
-                            if standings_data and 'teams' in standings_data:
-                                teams_sorted = sorted(standings_data['teams'], 
-                                                    key=lambda x: x['stats']['standings']['winPct'], 
-                                                    reverse=True)
-                                for rank, team in enumerate(teams_sorted, 1):
-                                    abbr = team['team']['abbreviation']
-                                    if abbr == 'BRO':
-                                        abbr = 'BKN'
-                                    elif abbr == 'OKL':
-                                        abbr = 'OKC'
-                                    overall_standings[abbr] = {'overall_rank': rank}
-                        
-                        # Get team stats for that date
-                        time.sleep(self.request_delay)
-                        stats_response = requests.get(stats_url, auth=self.auth)
-                        if stats_response.status_code == 429:
-                            time.sleep(self.retry_delay)
-                            stats_response = requests.get(stats_url, auth=self.auth)
-                        
-                        stats_rankings = {}
-                        if stats_response.status_code == 200:
-                            stats_data = stats_response.json()
-                            if stats_data and 'teamStatsTotals' in stats_data:
-                                all_teams = stats_data['teamStatsTotals']
-                                teams_off = sorted(all_teams, key=lambda x: x['stats']['offense']['ptsPerGame'], reverse=True)
-                                teams_def = sorted(all_teams, key=lambda x: x['stats']['defense'].get('oppPtsPerGame', x['stats']['defense'].get('ptsAgainstPerGame', 0)))
-                                
-                                for team in all_teams:
-                                    abbr = team['team']['abbreviation']
-                                    if abbr == 'BRO':
-                                        abbr = 'BKN'
-                                    elif abbr == 'OKL':
-                                        abbr = 'OKC'
-                                    
-                                    off_rank = next((idx for idx, t in enumerate(teams_off, 1) if t['team']['abbreviation'] == team['team']['abbreviation']), 15)
-                                    def_rank = next((idx for idx, t in enumerate(teams_def, 1) if t['team']['abbreviation'] == team['team']['abbreviation']), 15)
-                                    
-                                    stats_rankings[abbr] = {
-                                        'offensive_rank': off_rank,
-                                        'defensive_rank': def_rank
-                                    }
+                        overall_standings, stats_rankings = self._get_combined_season_data(season, formatted_date)
                     
                     # Extract rankings for this team
                     overall_rank = overall_standings.get(team_abbr, {}).get('overall_rank', 15)
@@ -328,7 +417,7 @@ class TeamRankingsCollector:
             print(f"      Error fetching historical rankings: {e}")
             return [{'game_num': i+1, 'overall_rank': 15, 'offensive_rank': 15, 'defensive_rank': 15} for i in range(num_games)]
     
-    def collect(self, away_team: str, home_team: str, game_date: str) -> Dict:
+    def collect(self, away_team: str, home_team: str, game_date: str, include_historical: bool = True) -> Dict:
         """
         Main collection method for team rankings
         
@@ -336,6 +425,7 @@ class TeamRankingsCollector:
             away_team: Away team abbreviation
             home_team: Home team abbreviation
             game_date: Game date in YYYYMMDD format
+            include_historical: Fetch per-game ranking history for the rankings charts
             
         Returns:
             Dictionary containing ranking data for both teams
@@ -344,13 +434,13 @@ class TeamRankingsCollector:
         
         season = self._get_season(game_date)
         
-        # Get overall standings/rankings
-        print(f"    Getting overall standings...")
-        overall_rankings = self._get_overall_standings(season)
+        # Get overall standings and offensive/defensive rankings from one team stats request
+        print(f"    Getting standings and team stats rankings...")
+        overall_rankings, stats_rankings = self._get_combined_season_data(season)
         
-        # Get offensive/defensive rankings
-        print(f"    Getting team stats rankings...")
-        stats_rankings = self._get_team_stats_rankings(season)
+        # Conference/division places in team stats are win% order; the report shows the
+        # official standings ranks, which apply MSF's tiebreakers
+        standings_ranks = self._get_standings_ranks(season)
         
         # Combine data for both teams
         away_rankings = {}
@@ -360,15 +450,19 @@ class TeamRankingsCollector:
             away_rankings.update(overall_rankings[away_team])
         if away_team in stats_rankings:
             away_rankings.update(stats_rankings[away_team])
+        if away_team in standings_ranks:
+            away_rankings.update(standings_ranks[away_team])
         
         if home_team in overall_rankings:
             home_rankings.update(overall_rankings[home_team])
         if home_team in stats_rankings:
             home_rankings.update(stats_rankings[home_team])
+        if home_team in standings_ranks:
+            home_rankings.update(standings_ranks[home_team])
         
         # Get historical data for graphs (simplified for now)
-        away_historical = self._get_historical_rankings(away_team, game_date)
-        home_historical = self._get_historical_rankings(home_team, game_date)
+        away_historical = self._get_historical_rankings(away_team, game_date, enabled=include_historical)
+        home_historical = self._get_historical_rankings(home_team, game_date, enabled=include_historical)
         
         # Format the data
         rankings_data = {
@@ -9,6 +9,7 @@ import requests
 from typing import Dict, Optional
 from requests.auth import HTTPBasicAuth
 from dotenv import load_dotenv
+from src.data.collectors._seasons import season_for_date
 import time
 
 load_dotenv()
@@ -46,14 +47,7 @@ class TeamStatsCollector:
         """Convert common abbreviation to API abbreviation"""
         return self.common_to_api.get(common_abbr, common_abbr)
     
-    def _get_season(self, date: str) -> str:
-        """Determine season from date"""
-        year = int(date[:4])
-        month = int(date[4:6])
-        if month >= 10:
-            return f"{year}-{year+1}-regular"
-        else:
-            return f"{year-1}-{year}-regular"
+    _get_season = staticmethod(season_for_date)
     
     def _make_request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
         """Make API request with proper rate limiting and retry logic"""
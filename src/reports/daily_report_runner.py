@@ -23,6 +23,7 @@ from src.data.collectors.team_stats import TeamStatsCollector
 from src.data.collectors.rolling_stats import RollingStatsCollector  # Added rolling stats
 from src.reports.matchup_report_generator import MatchupReportGenerator
 from src.data.collectors.team_rankings import TeamRankingsCollector
+from src.data.collectors._seasons import season_for_date
 
 load_dotenv()
 
@@ -47,7 +48,8 @@ class DailyReportRunner:
         }
         
         # Initialize collectors and generators
-        self.header_collector = GameHeaderCollector()
+        # One league-wide games fetch serves every matchup in the slate
+        self.header_collector = GameHeaderCollector(season_wide=True)
         self.stats_collector = TeamStatsCollector()
         self.rolling_collector = RollingStatsCollector()  # Added rolling stats collector
         self.report_generator = MatchupReportGenerator()
@@ -61,18 +63,17 @@ class DailyReportRunner:
         self.processed_games = []
         self.failed_games = []
     
+    def close(self):
+        """Release the collectors' pooled connections and cache handles"""
+        self.header_collector.close()
+        self.rolling_collector.close()
+        self.rankings_collector.close()
+    
     def _convert_to_common_abbr(self, api_abbr: str) -> str:
         """Convert API abbreviation to common abbreviation"""
         return self.api_to_common.get(api_abbr, api_abbr)
     
-    def _get_season(self, date: str) -> str:
-        """Determine season from date"""
-        year = int(date[:4])
-        month = int(date[4:6])
-        if month >= 10:
-            return f"{year}-{year+1}-regular"
-        else:
-            return f"{year-1}-{year}-regular"
+    _get_season = staticmethod(season_for_date)
     
     def get_games_for_date(self, date: str) -> List[Dict]:
         """Fetch all games for a specific date with rate limiting"""
@@ -488,12 +489,15 @@ if __name__ == "__main__":
     
     runner = DailyReportRunner()
     
-    if args.yesterday:
-        summary = runner.run_for_yesterday()
-    elif args.date:
-        summary = runner.run_daily_reports(args.date, not args.exclude_unplayed)
-    else:
-        summary = runner.run_for_today()
+    try:
+        if args.yesterday:
+            summary = runner.run_for_yesterday()
+        elif args.date:
+            summary = runner.run_daily_reports(args.date, not args.exclude_unplayed)
+        else:
+            summary = runner.run_for_today()
+    finally:
+        runner.close()
     
     print(f"\n✅ Daily report generation complete!")
     print(f"📂 View all reports at: output/daily_reports/{summary['date_code']}/index.html")
\ No newline at end of file
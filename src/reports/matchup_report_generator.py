@@ -7,6 +7,7 @@ Creates HTML reports with comprehensive home/away statistics and team stats
 import json
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import as_completed
 from jinja2 import Template
 
 class MatchupReportGenerator:
@@ -52,16 +53,23 @@ class MatchupReportGenerator:
             'SAS': {'primary': '#C4CED4', 'secondary': '#000000'}
         }
     
-    def generate_report(self, data: dict, output_filename: str = None):
-        """Generate HTML report from matchup data"""
+    def generate_report(self, data, output_filename: str = None):
+        """
+        Generate HTML report from matchup data
+        
+        data is either the collected dict or an iterable of futures that each
+        resolve to part of it (see GameHeaderCollector.collect_stream)
+        """
+        # Submit any streamed sections, then compile the template while they run
+        futures = None if isinstance(data, dict) else list(data)
+        template = Template(self.get_template())
+        if futures is not None:
+            data = self._assemble(futures)
         
         # Fix logo paths to be relative from output/html/ directory
         data['away_team']['logo_path'] = f"../../assets/teams/{data['away_team']['abbreviation']}.png"
         data['home_team']['logo_path'] = f"../../assets/teams/{data['home_team']['abbreviation']}.png"
         
-        # Create HTML template
-        template = Template(self.get_template())
-        
         # Add team colors to data
         away_abbr = data['away_team']['abbreviation']
         home_abbr = data['home_team']['abbreviation']
@@ -82,6 +90,19 @@ class MatchupReportGenerator:
         print(f"Report generated: {output_path}")
         return output_path
     
+    def _assemble(self, futures) -> dict:
+        """Merge partial section dicts one level deep as their futures complete"""
+        data = {}
+        for future in as_completed(futures):
+            for key, value in future.result().items():
+                if isinstance(value, dict) and isinstance(data.get(key), dict):
+                    data[key].update(value)
+                elif isinstance(value, dict):
+                    data[key] = dict(value)  # Copy so the futures' own results stay untouched
+                else:
+                    data[key] = value
+        return data
+    
     def get_template(self):
         """Return the enhanced HTML template with home/away statistics"""
         return '''
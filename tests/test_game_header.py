@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Offline tests for GameHeaderCollector record calculations
+Run from project root: python -m pytest tests
+"""
+
+import json
+
+import pytest
+
+from src.data.collectors import game_header
+from src.data.collectors.game_header import GameHeaderCollector, _parse_games
+
+
+def _game(day, away, home, away_score, home_score):
+    """A completed games.json entry; schedule.id is MSF's numeric game id"""
+    return {
+        'schedule': {
+            'id': 137600 + day,
+            'startTime': f'2025-01-{day:02d}T00:30:00.000Z',
+            'playedStatus': 'COMPLETED',
+            'awayTeam': {'abbreviation': away},
+            'homeTeam': {'abbreviation': home},
+        },
+        'score': {'awayScoreTotal': away_score, 'homeScoreTotal': home_score},
+    }
+
+
+# MIL goes L, W, W, L by date, but the API returns the games in a different order
+OUT_OF_ORDER = {'games': [
+    _game(8, 'MIL', 'BOS', 110, 100),
+    _game(11, 'PHI', 'MIL', 120, 101),
+    _game(2, 'MIL', 'NYK', 95, 99),
+    _game(5, 'CHI', 'MIL', 98, 104),
+]}
+
+
+def _parse_with_msgspec(data):
+    if game_header._GAMES_DECODER is None:
+        pytest.skip('msgspec not installed')
+    return game_header._decode_games(json.dumps(data).encode())
+
+
+@pytest.mark.parametrize('parse', [_parse_games, _parse_with_msgspec])
+def test_game_dates_come_from_start_time(parse):
+    games = parse(OUT_OF_ORDER)
+    assert [g.date for g in games] == [20250108, 20250111, 20250102, 20250105]
+
+
+@pytest.mark.parametrize('parse', [_parse_games, _parse_with_msgspec])
+def test_recent_form_follows_game_dates(parse):
+    collector = GameHeaderCollector(use_cache=False)
+    try:
+        records = collector._split_records('MIL', parse(OUT_OF_ORDER))
+    finally:
+        collector.close()
+
+    assert records['streak'] == 'L1'
+    assert records['last_3'] == '2-1'
+    assert records['last_7'] == '2-2'
+    assert records['home'] == '1-1'
+    assert records['away'] == '1-1'